@@ -5,12 +5,145 @@ AO3 Scraper
 A basic scraper for the Archive Of Our Own website.
 """
 
-from . import abc as abc, utils as utils
-from .client import *
-from .enums import *
-from .errors import *
-from .object import Object as Object
-from .search import *
-from .series import *
-from .user import *
-from .work import *
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from . import abc as abc, utils as utils
+    from .client import Client as Client
+    from .enums import (
+        ArchiveWarningId as ArchiveWarningId,
+        CategoryId as CategoryId,
+        FandomKey as FandomKey,
+        Language as Language,
+        RatingId as RatingId,
+    )
+    from .errors import (
+        AO3Exception as AO3Exception,
+        AuthError as AuthError,
+        BookmarkError as BookmarkError,
+        CollectError as CollectError,
+        DownloadError as DownloadError,
+        DuplicateCommentError as DuplicateCommentError,
+        HTTPException as HTTPException,
+        InvalidURLError as InvalidURLError,
+        KudoError as KudoError,
+        LoginFailure as LoginFailure,
+        PseudError as PseudError,
+        SubscribeError as SubscribeError,
+        UnloadedError as UnloadedError,
+    )
+    from .object import Object as Object
+    from .search import (
+        BookmarkSearch as BookmarkSearch,
+        BookmarkSearchOptions as BookmarkSearchOptions,
+        PeopleSearch as PeopleSearch,
+        PeopleSearchOptions as PeopleSearchOptions,
+        Search as Search,
+        TagSearch as TagSearch,
+        TagSearchOptions as TagSearchOptions,
+        WorkSearch as WorkSearch,
+        WorkSearchOptions as WorkSearchOptions,
+    )
+    from .series import Series as Series
+    from .user import User as User
+    from .work import Work as Work
+
+
+# The public names of each submodule. They're only imported on first access (see PEP 562), so that `import ao3` doesn't
+# pull in aiohttp and lxml until something that needs them is actually used.
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "client": ("Client",),
+    "enums": ("RatingId", "ArchiveWarningId", "CategoryId", "Language", "FandomKey"),
+    "errors": (
+        "AO3Exception",
+        "HTTPException",
+        "LoginFailure",
+        "UnloadedError",
+        "AuthError",
+        "PseudError",
+        "KudoError",
+        "BookmarkError",
+        "SubscribeError",
+        "CollectError",
+        "InvalidURLError",
+        "DuplicateCommentError",
+        "DownloadError",
+    ),
+    "object": ("Object",),
+    "search": (
+        "WorkSearchOptions",
+        "PeopleSearchOptions",
+        "BookmarkSearchOptions",
+        "TagSearchOptions",
+        "Search",
+        "WorkSearch",
+        "PeopleSearch",
+        "BookmarkSearch",
+        "TagSearch",
+    ),
+    "series": ("Series",),
+    "user": ("User",),
+    "work": ("Work",),
+}
+_LAZY_SUBMODULES = ("abc", "utils")
+_LAZY_ATTRS = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+__all__ = (
+    "AO3Exception",
+    "ArchiveWarningId",
+    "AuthError",
+    "BookmarkError",
+    "BookmarkSearch",
+    "BookmarkSearchOptions",
+    "CategoryId",
+    "Client",
+    "CollectError",
+    "DownloadError",
+    "DuplicateCommentError",
+    "FandomKey",
+    "HTTPException",
+    "InvalidURLError",
+    "KudoError",
+    "Language",
+    "LoginFailure",
+    "Object",
+    "PeopleSearch",
+    "PeopleSearchOptions",
+    "PseudError",
+    "RatingId",
+    "Search",
+    "Series",
+    "SubscribeError",
+    "TagSearch",
+    "TagSearchOptions",
+    "UnloadedError",
+    "User",
+    "Work",
+    "WorkSearch",
+    "WorkSearchOptions",
+    "abc",
+    "utils",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
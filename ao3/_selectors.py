@@ -1,79 +1,103 @@
 from __future__ import annotations
 
-from functools import partial
+from types import MappingProxyType
 
-from lxml import cssselect
+from cssselect import HTMLTranslator
+from lxml import etree
 
 
 __all__ = (
     "WORK_SELECTORS",
+    "WORK_BANNER_SELECTORS",
     "SERIES_SELECTORS",
     "USER_SELECTORS",
 )
 
-CSSSelector = partial(cssselect.CSSSelector, translator="html")
+_translator = HTMLTranslator()
+
+
+def _xp(css: str) -> etree.XPath:
+    """Translate a CSS selector into a precompiled XPath expression."""
+
+    return etree.XPath(_translator.css_to_xpath(css))
 
 
 # fmt: off
 # Selectors for a work's front page.
-WORK_SELECTORS = {
-    "sub_id":           CSSSelector("ul.work.navigation.actions li.subscribe form"),
-    "title":            CSSSelector("h2.title"),
-    "authors":          CSSSelector('div.preface.group a[rel*="author"]'),
-    "summary":          CSSSelector("div.summary > blockquote.userstuff"),
-    "series":           CSSSelector("dl.work.meta.group dd.series span.position a"),
-    "restricted":       CSSSelector('img [title*="Restricted"]'),
-    "rating":           CSSSelector("dl.work.meta.group dd.rating.tags li"),
-    "warnings":         CSSSelector("dl.work.meta.group dd.warning.tags li"),
-    "categories":       CSSSelector("dl.work.meta.group dd.category.tags li"),
-    "fandoms":          CSSSelector("dl.work.meta.group dd.fandom.tags li"),
-    "relationships":    CSSSelector("dl.work.meta.group dd.relationship.tags li"),
-    "characters":       CSSSelector("dl.work.meta.group dd.character.tags li"),
-    "freeforms":        CSSSelector("dl.work.meta.group dd.freeform.tags li"),
-    "language":         CSSSelector("dl.work.meta.group dd.language"),
-    "date_published":   CSSSelector("dl.work.meta.group dl.stats > dd.published"),
-    "date_updated":     CSSSelector("dl.work.meta.group dl.stats > dd.updated"),
-    "nwords":           CSSSelector("dl.work.meta.group dl.stats > dd.words"),
-    "nchapters":        CSSSelector("dl.work.meta.group dl.stats > dd.chapters"),
-    "ncomments":        CSSSelector("dl.work.meta.group dl.stats > dd.comments"),
-    "nkudos":           CSSSelector("dl.work.meta.group dl.stats > dd.kudos"),
-    "nbookmarks":       CSSSelector("dl.work.meta.group dl.stats > dd.bookmarks"),
-    "nhits":            CSSSelector("dl.work.meta.group dl.stats > dd.hits"),
-}
+WORK_SELECTORS = MappingProxyType({
+    "sub_id":           _xp("ul.work.navigation.actions li.subscribe form"),
+    "title":            _xp("h2.title"),
+    "authors":          _xp('div.preface.group a[rel*="author"]'),
+    "summary":          _xp("div.summary > blockquote.userstuff"),
+    "series":           _xp("dl.work.meta.group dd.series span.position a"),
+    "restricted":       _xp('img [title*="Restricted"]'),
+    # Every <dd> in the meta block, stats included, in document order. Dispatched on by class in Work._meta.
+    "meta":             _xp("dl.work.meta.group > dd, dl.work.meta.group dl.stats > dd"),
+    "meta_tags":        _xp("li"),
+})
+
+
+# Selectors for the fields of a work stub (a "blurb"), relative to the blurb element.
+WORK_BANNER_SELECTORS = MappingProxyType({
+    "link":             _xp('a[href^="/works"]'),
+    "authors":          _xp('h4 a > [rel*="author"]'),
+    "restricted":       _xp('img [title*="Restricted"]'),
+    "series":           _xp(".series a"),
+    "summary":          _xp(".userstuff.summary"),
+    "rating":           _xp(".required-tags .rating"),
+    "warnings":         _xp(".tags li.warnings"),
+    "categories":       _xp(".required-tags .category"),
+    "fandoms":          _xp("h5.fandoms a"),
+    "relationships":    _xp(".tags li.relationships"),
+    "characters":       _xp(".tags li.characters"),
+    "freeforms":        _xp(".tags li.freeforms"),
+    "language":         _xp(".stats dd.language"),
+    "date":             _xp("p.datetime"),
+    "words":            _xp(".stats dd.words"),
+    "chapters":         _xp(".stats dd.chapters"),
+    "comments":         _xp(".stats dd.comments"),
+    "kudos":            _xp(".stats dd.kudos"),
+    "bookmarks":        _xp(".stats dd.bookmarks"),
+    "hits":             _xp(".stats dd.hits"),
+})
 
 
 # Selectors for a work stub on a series/user/search/etc. page.
-SEARCH_SELECTOR = {
-    "work":             CSSSelector("li.work.blurb.group"),
-    "people":           CSSSelector("li.user.blurb.group"),
-    "bookmark":         CSSSelector("li.bookmark.blurb.group"),
-    "tag":              CSSSelector("ol.tag.index.group > li"),
-}
+SEARCH_SELECTOR = MappingProxyType({
+    "work":             _xp("li.work.blurb.group"),
+    "people":           _xp("li.user.blurb.group"),
+    "bookmark":         _xp("li.bookmark.blurb.group"),
+    "tag":              _xp("ol.tag.index.group > li"),
+    "total":            _xp("h3"),
+    "people_total":     _xp("div.people-search.region p strong"),
+    "user_link":        _xp("h4.heading > a"),
+    "canonical":        _xp("span.canonical"),
+})
 
 
 # Selectors for a series page.
-SERIES_SELECTORS = {
-    "sub_btn":          CSSSelector('form[data-create-value="Subscribe"]'),
-    "name":             CSSSelector("div#main > h2.heading"),
-    "creators":         CSSSelector('dl.series.meta.group > dd > a[rel="author"]'),
-    "dates":            CSSSelector("dl.series.meta.group > dd"),
-    "descr":            CSSSelector("dl.series.meta.group > dd > blockquote.userstuff"),
-    "stats":            CSSSelector("dl.series.meta.group > dd.stats > dl.stats > dd"),
-    "works":            CSSSelector("ul.series.work.index.group > li"),
-}
+SERIES_SELECTORS = MappingProxyType({
+    "sub_btn":          _xp('form[data-create-value="Subscribe"]'),
+    "name":             _xp("div#main > h2.heading"),
+    "creators":         _xp('dl.series.meta.group > dd > a[rel="author"]'),
+    "dates":            _xp("dl.series.meta.group > dd"),
+    "descr":            _xp("dl.series.meta.group > dd > blockquote.userstuff"),
+    "stats":            _xp("dl.series.meta.group > dd.stats > dl.stats > dd"),
+    "works":            _xp("ul.series.work.index.group > li"),
+})
 
 
 # Selectors for a user's profile page.
-USER_SELECTORS = {
-    "profile_info":     CSSSelector("dl.meta dd"),
-    "sub_id":           CSSSelector("div.primary.header.module form[action]"),
-    "avatar":           CSSSelector("img.icon"),
-    "pseuds":           CSSSelector("dl.meta > dd.pseuds > a"),
-    "bio":              CSSSelector("div.bio.module > blockquote.userstuff"),
-    "nworks":           CSSSelector('ul.navigation.actions > li > a[href$="works"]'),
-    "nseries":          CSSSelector('ul.navigation.actions > li > a[href$="series"]'),
-    "nbookmarks":       CSSSelector('ul.navigation.actions > li > a[href$="bookmarks"]'),
-    "ncollections":     CSSSelector('ul.navigation.actions > li > a[href$="collections"]'),
-    "ngifts":           CSSSelector('ul.navigation.actions > li > a[href$="gifts"]'),
-}
+USER_SELECTORS = MappingProxyType({
+    "profile_info":     _xp("dl.meta dd"),
+    "sub_id":           _xp("div.primary.header.module form[action]"),
+    "avatar":           _xp("img.icon"),
+    "pseuds":           _xp("dl.meta > dd.pseuds > a"),
+    "bio":              _xp("div.bio.module > blockquote.userstuff"),
+    "nworks":           _xp('ul.navigation.actions > li > a[href$="works"]'),
+    "nseries":          _xp('ul.navigation.actions > li > a[href$="series"]'),
+    "nbookmarks":       _xp('ul.navigation.actions > li > a[href$="bookmarks"]'),
+    "ncollections":     _xp('ul.navigation.actions > li > a[href$="collections"]'),
+    "ngifts":           _xp('ul.navigation.actions > li > a[href$="gifts"]'),
+})
 # fmt: on
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from abc import abstractmethod
-from typing import TYPE_CHECKING, Protocol, TypeVar, Union, runtime_checkable
+import asyncio
+import operator
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar, Union
+from urllib.parse import urlsplit
 
-from lxml import html
+from lxml import etree
 
 from .errors import (
     AO3_AUTH_ERROR_URL,
@@ -16,10 +20,17 @@ from .errors import (
     SubscribeError,
     UnloadedError,
 )
-from .utils import CachedSlotProperty, cached_slot_property, extract_csrf_token, extract_pseud_id
+from .utils import (
+    CachedSlotProperty,
+    _parse_html_off_loop,
+    cached_slot_property,
+    extract_csrf_token,
+    extract_pseud_id,
+)
 
 
 if TYPE_CHECKING:
+    from lxml import html
     from typing_extensions import Self
 
     from .http import HTTPClient
@@ -32,6 +43,22 @@ T2 = TypeVar("T2")
 any_property = Union[property, CachedSlotProperty[T1, T2]]
 
 
+# Kept in sync with ao3.http.AO3_BASE_URL, which isn't imported here so that this module doesn't pull in aiohttp.
+_AO3_ROOT = "https://archiveofourown.org"
+_AO3_ROOT_SLASH = _AO3_ROOT + "/"
+
+# Equivalent to the CSS selector 'div#bookmark-form > form[action^="/bookmark"]'.
+_BOOKMARK_FORM_XP = etree.XPath("descendant::div[@id='bookmark-form']/form[starts-with(@action, '/bookmark')]")
+
+# Equivalent to the CSS selectors 'div.notice, div.error' and 'ul'. The flash messages are matched in one pass and
+# told apart afterwards.
+_FLASH_XP = etree.XPath(
+    "descendant-or-self::div[contains(concat(' ', normalize-space(@class), ' '), ' notice ') "
+    "or contains(concat(' ', normalize-space(@class), ' '), ' error ')]",
+)
+_UL_XP = etree.XPath("descendant-or-self::ul")
+
+
 __all__ = (
     "Page",
     "KudoableMixin",
@@ -39,12 +66,36 @@ __all__ = (
     "SubscribableMixin",
     "CommentableMixin",
     "CollectableMixin",
+    "reload_many",
 )
 
 
-@runtime_checkable
-class Page(Protocol):
-    """An protocol/ABC that details the common members and operations of AO3 items.
+def _url_path(url: str) -> str:
+    # Every item URL is built on the AO3 root, so slicing it off is the common case. str.removeprefix() is 3.9+.
+    if url.startswith(_AO3_ROOT_SLASH):
+        return url[len(_AO3_ROOT) :]
+    return urlsplit(url).path
+
+
+def _check_required_slots(cls: type, owner: type, required: tuple[str, ...]) -> None:
+    # cached_slot_property() stores its result in a slot that only the concrete class can declare. Catch a missing one
+    # when the class is created instead of on first access. Classes with an instance __dict__ don't need the slots.
+    mro = cls.__mro__[:-1]
+    if any("__slots__" not in klass.__dict__ for klass in mro):
+        return
+
+    available: set[str] = set()
+    for klass in mro:
+        slots = klass.__dict__["__slots__"]
+        available.update((slots,) if isinstance(slots, str) else slots)
+
+    if missing := [name for name in required if name not in available]:
+        msg = f"{cls.__name__} must declare the following slots to subclass {owner.__name__}: {', '.join(missing)}"
+        raise TypeError(msg)
+
+
+class Page(ABC):
+    """An ABC that details the common members and operations of AO3 items.
 
     Attributes
     ----------
@@ -59,15 +110,25 @@ class Page(Protocol):
     _element: html.HtmlElement | None
     _authenticity_token: str | None
 
-    @property
-    def raw_element(self) -> html.HtmlElement | None:
-        """:class:`html.HtmlElement` | None: A representation of the raw HTML for this item's corresponding AO3
-        webpage.
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _check_required_slots(cls, Page, ("_authenticity_token",))
 
-        If not provided, then this is ``None``.
-        """
+    if TYPE_CHECKING:
 
-        return self._element
+        @property
+        def raw_element(self) -> html.HtmlElement | None: ...
+
+    else:
+        # Hot path for nearly every parsed member; attrgetter() keeps the lookup in C instead of a Python frame.
+        raw_element = property(
+            operator.attrgetter("_element"),
+            doc=""":class:`html.HtmlElement` | None: A representation of the raw HTML for this item's corresponding AO3
+            webpage.
+
+            If not provided, then this is ``None``.
+            """,
+        )
 
     @cached_slot_property("_authenticity_token")
     def authenticity_token(self) -> str | None:
@@ -75,13 +136,54 @@ class Page(Protocol):
             return None
         return extract_csrf_token(self.raw_element)
 
+    async def _auth_token(self) -> str:
+        # A logged-in session's token takes precedence, so only look up the page's CSRF token when there isn't one.
+        http = self._http
+        token = await http.get_auth_token() if http.state is not None else self.authenticity_token
+        if token is None:
+            raise AuthError
+        return token
+
     @abstractmethod
     async def reload(self) -> None:
-        """Reloads the item's corresponding webpage to update its members."""
+        """Reloads the item's corresponding webpage to update its members.
+
+        Implementations should parse the fetched page with ``_parse_html_off_loop()`` rather than calling
+        :func:`lxml.html.fromstring` directly, so the event loop isn't blocked while large pages are parsed.
+        """
 
         raise NotImplementedError
 
 
+async def reload_many(pages: Iterable[Page], concurrency: int = 20) -> None:
+    """Reload multiple items concurrently, sharing the underlying HTTP session.
+
+    Parameters
+    ----------
+    pages: Iterable[:class:`Page`]
+        The items to reload.
+    concurrency: :class:`int`, optional
+        The maximum number of reloads that may be in flight at once. By default 20.
+
+    Raises
+    ------
+    ValueError
+        The concurrency was less than 1.
+    """
+
+    if concurrency < 1:
+        msg = "concurrency must be at least 1."
+        raise ValueError(msg)
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def reload_one(page: Page) -> None:
+        async with sem:
+            await page.reload()
+
+    await asyncio.gather(*(reload_one(page) for page in pages))
+
+
 class KudoableMixin:
     """A mixin that adds kudo-giving members and functionality to AO3 items that can receive kudos.
 
@@ -96,7 +198,7 @@ class KudoableMixin:
 
     id: any_property[Self, int]
     _http: HTTPClient
-    authenticity_token: CachedSlotProperty[Self, str | None]
+    _auth_token: Callable[[], Awaitable[str]]
 
     @property
     def kudoable_type(self) -> str:
@@ -117,13 +219,11 @@ class KudoableMixin:
             Something went wrong in the kudoing process.
         """
 
-        auth_token = getattr(self._http.state, "login_token", self.authenticity_token)
-
-        if auth_token is None:
-            raise AuthError
+        http = self._http
+        auth_token = await self._auth_token()
 
         try:
-            await self._http.give_kudos(auth_token, self.id, self.kudoable_type)
+            await http.give_kudos(auth_token, self.id, self.kudoable_type)
         except HTTPException as err:
             raise KudoError from err
 
@@ -143,17 +243,22 @@ class BookmarkableMixin:
 
     id: any_property[Self, int]
     _http: HTTPClient
-    authenticity_token: CachedSlotProperty[Self, str | None]
+    _auth_token: Callable[[], Awaitable[str]]
     raw_element: property | html.HtmlElement
     url: property | str
     _cs_bookmark_id: int | None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _check_required_slots(cls, BookmarkableMixin, ("_cs_bookmark_id",))
+
     @cached_slot_property("_cs_bookmark_id")
     def bookmark_id(self) -> int | None:
-        if self.raw_element is None or not self._http.state:
+        element = self.raw_element
+        if element is None or not self._http.state:
             return None
         try:
-            el = self.raw_element.cssselect('div#bookmark-form > form[action^="/bookmark"]')[0]
+            el = _BOOKMARK_FORM_XP(element)[0]
             return int(text.split("/")[-1]) if (text := el.get("action")) else None
         except (IndexError, ValueError):
             return None
@@ -161,8 +266,8 @@ class BookmarkableMixin:
     async def bookmark(
         self,
         notes: str = "",
-        tags: list[str] | None = None,
-        collections: list[str] | None = None,
+        tags: Sequence[str] = (),
+        collections: Sequence[str] = (),
         private: bool = False,
         recommend: bool = False,
         as_pseud: str | None = None,
@@ -175,10 +280,10 @@ class BookmarkableMixin:
         ----------
         notes: :class:`str`, optional
             The notes to add to this bookmark. By default "".
-        tags: list[:class:`str`] | None, optional
-            The tags to add to this bookmark. By default None.
-        collections: list[:class:`str`] | None, optional
-            The collections to add this bookmark to. By default None.
+        tags: Sequence[:class:`str`], optional
+            The tags to add to this bookmark. By default none.
+        collections: Sequence[:class:`str`], optional
+            The collections to add this bookmark to. By default none.
         private: :class:`bool`, optional
             Whether to make this bookmark private. By default False.
         recommend: :class:`bool`, optional
@@ -198,23 +303,23 @@ class BookmarkableMixin:
             ID for specified or default pseud could not be found.
         """
 
-        auth_token = getattr(self._http.state, "login_token", self.authenticity_token)
+        http = self._http
+        auth_token = await self._auth_token()
 
-        if auth_token is None:
-            raise AuthError
-        if self.raw_element is None:
+        element = self.raw_element
+        if element is None:
             raise UnloadedError
         if self.bookmark_id is not None:
             msg = "This item has already been bookmarked."
             raise BookmarkError(msg)
 
-        pseud_id = extract_pseud_id(self.raw_element, as_pseud if as_pseud else None)
+        pseud_id = extract_pseud_id(element, as_pseud if as_pseud else None)
         if pseud_id is None:
             raise PseudError(as_pseud)
 
         try:
-            path = self.url.partition(".org")[-1]
-            resp = await self._http.bookmark(auth_token, path, notes, tags, collections, private, recommend, pseud_id)
+            path = _url_path(self.url)
+            resp = await http.bookmark(auth_token, path, notes, tags, collections, private, recommend, pseud_id)
         except HTTPException as err:
             raise BookmarkError from err
         else:
@@ -231,16 +336,16 @@ class BookmarkableMixin:
             Something went wrong in the bookmarking process.
         """
 
-        auth_token = getattr(self._http.state, "login_token", self.authenticity_token)
+        http = self._http
+        auth_token = await self._auth_token()
 
-        if auth_token is None:
-            raise AuthError
-        if self.bookmark_id is None:
+        bookmark_id = self.bookmark_id
+        if bookmark_id is None:
             msg = "This item has not been bookmarked yet."
             raise BookmarkError(msg)
 
         try:
-            await self._http.delete_bookmark(auth_token, self.bookmark_id)
+            await http.delete_bookmark(auth_token, bookmark_id)
         except HTTPException as err:
             raise BookmarkError from err
         else:
@@ -263,8 +368,13 @@ class SubscribableMixin:
 
     id: any_property[Self, int]
     _http: HTTPClient
-    authenticity_token: CachedSlotProperty[Self, str | None]
+    _auth_token: Callable[[], Awaitable[str]]
     sub_id: CachedSlotProperty[Self, int | None]
+    _cs_sub_id: int | None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _check_required_slots(cls, SubscribableMixin, ("_cs_sub_id",))
 
     @property
     def subable_type(self) -> str:
@@ -285,18 +395,18 @@ class SubscribableMixin:
             Something went wrong in the subscription process.
         """
 
-        auth_token = getattr(self._http.state, "login_token", self.authenticity_token)
+        http = self._http
+        state = http.state
+        auth_token = await self._auth_token()
 
-        if auth_token is None:
-            raise AuthError
         if self.sub_id is not None:
             msg = "This item has already been subscribed to."
             raise SubscribeError(msg)
 
-        assert self._http.state  # Not sure if this is accurate.
-        client_username = self._http.state.client_user.username
+        assert state  # Not sure if this is accurate.
+        client_username = state.client_user.username
         try:
-            data = await self._http.subscribe(auth_token, client_username, self.id, self.subable_type)
+            data = await http.subscribe(auth_token, client_username, self.id, self.subable_type)
         except HTTPException as err:
             raise SubscribeError from err
         else:
@@ -313,18 +423,19 @@ class SubscribableMixin:
             Something went wrong in the subscription process.
         """
 
-        auth_token = getattr(self._http.state, "login_token", self.authenticity_token)
+        http = self._http
+        state = http.state
+        auth_token = await self._auth_token()
 
-        if auth_token is None:
-            raise AuthError
-        if self.sub_id is None:
+        sub_id = self.sub_id
+        if sub_id is None:
             msg = "This item has not been subscribed to yet."
             raise SubscribeError(msg)
 
-        assert self._http.state  # Not sure if this is accurate.
-        client_username = self._http.state.client_user.username
+        assert state  # Not sure if this is accurate.
+        client_username = state.client_user.username
         try:
-            await self._http.unsubscribe(auth_token, client_username, self.id, self.subable_type, self.sub_id)
+            await http.unsubscribe(auth_token, client_username, self.id, self.subable_type, sub_id)
         except HTTPException as err:
             raise SubscribeError from err
         else:
@@ -352,7 +463,7 @@ class CollectableMixin:
 
     id: any_property[Self, int]
     _http: HTTPClient
-    authenticity_token: CachedSlotProperty[Self, str | None]
+    _auth_token: Callable[[], Awaitable[str]]
     url: property | str
 
     async def collect(self, collections: list[str]) -> None:
@@ -366,33 +477,44 @@ class CollectableMixin:
             Something went wrong in the collection process.
         """
 
-        auth_token = getattr(self._http.state, "login_token", self.authenticity_token)
-
-        if auth_token is None:
-            raise AuthError
+        http = self._http
+        auth_token = await self._auth_token()
 
         try:
-            path = self.url.partition(".org")[-1]
-            resp, text = await self._http.collect(auth_token, path, ",".join(collections))
+            path = _url_path(self.url)
+            resp, text = await http.collect(auth_token, path, ",".join(collections))
         except HTTPException as err:
             raise CollectError from err
         else:
             # TODO: Investigate if there's a better way to handle this.
             # Since AO3 doesn't return negative response codes for this, apparently, we need to manually parse the page
             # to determine success or failure.
-            if resp.status == 302 and resp.headers["Location"] == AO3_AUTH_ERROR_URL:
+            status = resp.status
+            if status == 302 and resp.headers.get("Location") == AO3_AUTH_ERROR_URL:
                 raise AuthError
-            if resp.status == 200:
-                element = html.fromstring(text)
-                notice_el, error_el = element.cssselect("div.notice"), element.cssselect("div.error")
-                if len(notice_el) == 0 and len(error_el) == 0:
-                    raise CollectError
-
-                if len(error_el) > 0:
-                    errors = [str(el.text_content()) for el in error_el[0].cssselect("ul")]
-
-                    if len(errors) > 0:
-                        msg = f"We couldn't add your submission to the following collection(s): {', '.join(errors)}"
-                        raise CollectError(msg)
-
-                    raise CollectError
+            if status != 200:
+                return
+
+            # Neither flash message can be on the page if their class names never show up in it, so skip parsing then.
+            if "notice" not in text and "error" not in text:
+                raise CollectError
+
+            element = await _parse_html_off_loop(text)
+            notice_el: list[html.HtmlElement] = []
+            error_el: list[html.HtmlElement] = []
+            for el in _FLASH_XP(element):
+                class_names = (el.get("class") or "").split()
+                if "notice" in class_names:
+                    notice_el.append(el)
+                if "error" in class_names:
+                    error_el.append(el)
+
+            if len(notice_el) == 0 and len(error_el) == 0:
+                raise CollectError
+
+            if len(error_el) > 0:
+                if errors := ", ".join("".join(el.itertext()) for el in _UL_XP(error_el[0])):
+                    msg = f"We couldn't add your submission to the following collection(s): {errors}"
+                    raise CollectError(msg)
+
+                raise CollectError
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING, TypeVar
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Final, TypeVar
 
 import aiohttp
-from lxml import html
 
 from .errors import LoginFailure
 from .http import AuthState, HTTPClient
@@ -13,6 +14,8 @@ from .search import (
     BookmarkSearchOptions,
     PeopleSearch,
     PeopleSearchOptions,
+    Search,
+    SearchOptions,
     TagSearch,
     TagSearchOptions,
     WorkSearch,
@@ -20,17 +23,28 @@ from .search import (
 )
 from .series import Series
 from .user import User
+from .utils import _parse_html_off_loop
 from .work import Work
 
 
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from lxml import html
     from typing_extensions import Self
 else:
     TracebackType = Self = object
 
 BE = TypeVar("BE", bound=BaseException)
+S = TypeVar("S", bound="Search[Any, Any]")
+
+# AO3 is a volunteer-run site that throttles aggressive clients, so never have more than this many page requests from
+# one search in flight, whatever the caller asks for.
+_MAX_SEARCH_CONCURRENCY: Final = 10
+
+# How long, in seconds, a fetched work/series/user page may be reused, and how many such pages are kept at most.
+_PAGE_CACHE_TTL: Final = 60.0
+_PAGE_CACHE_MAXSIZE: Final = 64
 
 __all__ = ("Client",)
 
@@ -41,14 +55,36 @@ class Client:
     Parameters
     ----------
     session: :class:`aiohttp.ClientSession` | None, optional
-        The asynchronous HTTP session to make requests with. If not passed in, automatically generated. Closing it is
-        not handled automatically by the class.
+        The asynchronous HTTP session to make requests with. If not passed in, one with a pooled, keep-alive connector
+        is created on the first request and closed along with the client. A session that is passed in is never closed
+        by the client, so it can be shared between several clients and should be closed by its owner once they're all
+        done. Connections are only reused for as long as their session lives, so prefer one long-lived client or
+        session over a new one per task.
+    connector: :class:`aiohttp.BaseConnector` | None, optional
+        The connector to use for the session the client creates, e.g. to tune connection limits. Ignored if `session`
+        is passed in. Like a passed-in session, it is never closed by the client.
+    max_concurrency: :class:`int`, optional
+        The maximum number of requests to AO3 that may be in flight at once. Any more wait their turn. Downloads only
+        count against this while they're being opened. By default 10.
     """
 
-    def __init__(self, *, session: aiohttp.ClientSession | None = None) -> None:
-        self._http = HTTPClient(_session=session)
+    __slots__ = ("_http", "_page_cache")
+
+    def __init__(
+        self,
+        *,
+        session: aiohttp.ClientSession | None = None,
+        connector: aiohttp.BaseConnector | None = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        self._http = HTTPClient(_session=session, _connector=connector, max_concurrency=max_concurrency)
+        # Parsed pages by (kind, id), along with when they expire and the login state they were fetched under. Kept in
+        # least- to most-recently used order.
+        self._page_cache: dict[tuple[str, object], tuple[float, AuthState | None, html.HtmlElement]] = {}
 
     async def __aenter__(self) -> Self:
+        # Whatever the caller does first, it'll likely need a connection to AO3, so get one going already.
+        self._http.warm_up()
         return self
 
     async def __aexit__(
@@ -61,13 +97,127 @@ class Client:
 
     @property
     def user(self) -> User | None:
-        if state := self._http.state:
-            return state.client_user
-        return None
+        return self._http.client_user
 
     async def close(self) -> None:
         await self._http.close()
 
+    async def _search_pages(
+        self,
+        fetch: Callable[[int], Awaitable[S]],
+        start: int,
+        stop: int,
+        step: int,
+        concurrency: int,
+        unordered: bool,
+        page_size: int,
+    ) -> AsyncGenerator[S, None]:
+        # Shared driver for the *_search_pages() generators. Requests go out a window of pages at a time. Results are
+        # yielded in page order, stopping after the first page that isn't full, unless order was waived, in which case
+        # they're yielded as they arrive and iteration ends with the window that held a page that isn't full. Pages
+        # without any results are never yielded.
+        if stop < start or step < 1:
+            msg = "Please specify your start, stop, and step such that you only iterate forwards."
+            raise RuntimeError(msg)
+        if concurrency < 1:
+            msg = "concurrency must be at least 1."
+            raise ValueError(msg)
+        concurrency = min(concurrency, _MAX_SEARCH_CONCURRENCY)
+
+        page_nums = range(start, stop, step)
+        windows = [page_nums[i : i + concurrency] for i in range(0, len(page_nums), concurrency)]
+        if not windows:
+            return
+
+        if unordered:
+            for window in windows:
+                tasks = [asyncio.ensure_future(fetch(page_num)) for page_num in window]
+                is_last_window = False
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        page_results = await next_done
+                        nresults = len(page_results.results)
+                        is_last_window = is_last_window or nresults < page_size
+                        if nresults:
+                            yield page_results
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                if is_last_window:
+                    return
+            return
+
+        def fetch_window(window: range) -> asyncio.Future[list[S]]:
+            return asyncio.ensure_future(asyncio.gather(*(fetch(page_num) for page_num in window)))
+
+        # The next window is requested before the current one is handed over, so its network time overlaps with
+        # whatever the caller does with these pages. Anything still in flight is cancelled once iteration stops.
+        later_windows = iter(windows[1:])
+        pending: asyncio.Future[list[S]] | None = fetch_window(windows[0])
+        try:
+            while pending is not None:
+                window_results = await pending
+                is_last_window = any(len(page.results) < page_size for page in window_results)
+                next_window = next(later_windows, None)
+                pending = fetch_window(next_window) if (next_window and not is_last_window) else None
+
+                for page_results in window_results:
+                    nresults = len(page_results.results)
+                    if nresults:
+                        yield page_results
+                    if nresults < page_size:
+                        return
+        finally:
+            if pending is not None:
+                pending.cancel()
+                # Reap it, so that the cancellation isn't reported as an exception that was never retrieved.
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def _get_page(
+        self,
+        key: tuple[str, object],
+        request: Callable[[], Awaitable[bytes]],
+        cached: bool,
+    ) -> html.HtmlElement:
+        # For get_work() and friends: if the caller allows it, reuse a recently parsed copy of the same page if there is
+        # one, else fetch it. Only pages fetched that way are kept, since nothing here knows when one goes stale.
+        if not cached:
+            return await _parse_html_off_loop(await request())
+
+        cache = self._page_cache
+        state = self._http.state
+        now = time.monotonic()
+
+        if entry := cache.pop(key, None):
+            expires_at, cached_state, element = entry
+            if expires_at > now and cached_state is state:
+                cache[key] = entry
+                return element
+
+        element = await _parse_html_off_loop(await request())
+        cache.pop(key, None)
+        cache[key] = (now + _PAGE_CACHE_TTL, state, element)
+        if len(cache) > _PAGE_CACHE_MAXSIZE:
+            del cache[next(iter(cache))]
+        return element
+
+    async def _fetch_search_page(
+        self,
+        search_cls: type[S],
+        request: Callable[..., Awaitable[bytes]],
+        options: SearchOptions,
+        query: dict[str, Any],
+        page: int,
+    ) -> S:
+        # For the *_search_pages() generators, which serialize their options once and then only swap out the page.
+        # Updating the shared query in place is safe even with several pages in flight: unpacking it into the call
+        # copies it on the spot, before anything gets a chance to change it again.
+        query["page"] = page
+        text = await request(**query)
+        element = await _parse_html_off_loop(text)
+        return search_cls(self._http, payload={"_search_options": options.with_page(page)}, element=element)
+
     async def login(self, username: str | None = None, password: str | None = None) -> None:
         """Logs into AO3 with the specified credentials.
 
@@ -86,20 +236,23 @@ class Client:
 
         if username and password:
             login_token, text = await self._http.login(username, password)
-            element = html.fromstring(text)
+            element = await _parse_html_off_loop(text)
             payload = {"username": username}
             self._http.state = AuthState(login_token or "", User(self._http, payload=payload, element=element))
             return
         msg = "Please provide both a username and a password."
         raise LoginFailure(msg)
 
-    async def get_work(self, work_id: int) -> Work:
+    async def get_work(self, work_id: int, *, cached: bool = False) -> Work:
         """Returns a work with the given ID.
 
         Parameters
         ----------
         work_id: :class:`int`
             The ID to search for.
+        cached: :class:`bool`, optional
+            Whether a copy of the page fetched the same way within the last minute may be reused instead of fetching it
+            again. Such a copy won't reflect any changes made since, e.g. bookmarks or kudos. By default False.
 
         Returns
         -------
@@ -112,18 +265,20 @@ class Client:
             The id could not be used to find a valid work.
         """
 
-        text = await self._http.get_work(work_id)
-        element = html.fromstring(text)
+        element = await self._get_page(("work", work_id), lambda: self._http.get_work(work_id), cached)
         payload = {"_id": work_id}
         return Work(self._http, payload=payload, element=element)
 
-    async def get_series(self, series_id: int) -> Series:
+    async def get_series(self, series_id: int, *, cached: bool = False) -> Series:
         """Returns a series with the given ID.
 
         Parameters
         ----------
         series_id: :class:`int`
             The ID to search for.
+        cached: :class:`bool`, optional
+            Whether a copy of the page fetched the same way within the last minute may be reused instead of fetching it
+            again. Such a copy won't reflect any changes made since, e.g. bookmarks or kudos. By default False.
 
         Returns
         -------
@@ -136,18 +291,20 @@ class Client:
             The id could not be used to find a valid series.
         """
 
-        text = await self._http.get_series(series_id)
-        element = html.fromstring(text)
+        element = await self._get_page(("series", series_id), lambda: self._http.get_series(series_id), cached)
         payload = {"_id": series_id}
         return Series(self._http, payload=payload, element=element)
 
-    async def get_user(self, username: str) -> User:
+    async def get_user(self, username: str, *, cached: bool = False) -> User:
         """Returns a user with the given username.
 
         Parameters
         ----------
         username: :class:`str`
             The username to search for.
+        cached: :class:`bool`, optional
+            Whether a copy of the page fetched the same way within the last minute may be reused instead of fetching it
+            again. Such a copy won't reflect any changes made since, e.g. bookmarks or kudos. By default False.
 
         Returns
         -------
@@ -160,8 +317,7 @@ class Client:
             The username could not be used to find a valid user.
         """
 
-        text = await self._http.get_user(username)
-        element = html.fromstring(text)
+        element = await self._get_page(("user", username), lambda: self._http.get_user(username), cached)
         payload = {"username": username}
         return User(self._http, payload=payload, element=element)
 
@@ -180,19 +336,21 @@ class Client:
         """
 
         text = await self._http.search_works(**options.to_dict())
-        element = html.fromstring(text)
+        element = await _parse_html_off_loop(text)
         payload = {"_search_options": options}
         return WorkSearch(self._http, payload=payload, element=element)
 
-    async def work_search_pages(
+    def work_search_pages(
         self,
         options: WorkSearchOptions,
         start: int = 1,
         stop: int = 2,
         step: int = 1,
+        concurrency: int = 5,
+        unordered: bool = False,
     ) -> AsyncGenerator[WorkSearch, None]:
         """Returns an asynchronous generator for work search results based on the given options through multiple pages
-        of results. It stops at the first empty results page.
+        of results. It stops after the last page with results, without yielding empty pages.
 
         Can only iterate forwards, to reliably prevent requests to nonexistent pages from looping for longer than
         necessary.
@@ -207,23 +365,34 @@ class Client:
             The stopping page, which won't be included in the final result. By default 2.
         step: :class:`int`, optional
             The step size through which to iterate through the pages. By default 1.
+        concurrency: :class:`int`, optional
+            The maximum number of pages to request at once, capped at 10. By default 5.
+        unordered: :class:`bool`, optional
+            Whether to yield pages as soon as they arrive instead of in page order. By default False.
 
         Yields
         ------
         :class:`WorkSearch`
             The search result object holding the results for a particular page.
-        """
 
-        if stop < start or step < 1:
-            msg = "Please specify your start, stop, and step such that you only iterate forwards."
-            raise RuntimeError(msg)
+        Raises
+        ------
+        RuntimeError
+            The start, stop, and step aren't configured for forward iteration.
+        ValueError
+            The concurrency is less than 1.
+        """
 
-        for page_num in range(start, stop, step):
-            options.page = page_num
-            page_results = await self.search_works(options)
-            yield page_results
-            if len(page_results.results) < 20:
-                break
+        query = options.to_dict()
+        return self._search_pages(
+            lambda page_num: self._fetch_search_page(WorkSearch, self._http.search_works, options, query, page_num),
+            start,
+            stop,
+            step,
+            concurrency,
+            unordered,
+            20,
+        )
 
     async def search_people(
         self,
@@ -254,11 +423,11 @@ class Client:
         name_str = ",".join(names) if names else ""
         fandom_str = ",".join(fandoms) if fandoms else ""
         text = await self._http.search_people(page, any_field, name_str, fandom_str)
-        element = html.fromstring(text)
-        payload = {"_search_options": PeopleSearchOptions(page, any_field, name_str, fandom_str)}
+        element = await _parse_html_off_loop(text)
+        payload = {"_search_options": PeopleSearchOptions(page, any_field, names or [], fandoms or [])}
         return PeopleSearch(self._http, payload=payload, element=element)
 
-    async def people_search_pages(
+    def people_search_pages(
         self,
         any_field: str = "",
         names: list[str] | None = None,
@@ -266,9 +435,11 @@ class Client:
         start: int = 1,
         stop: int = 2,
         step: int = 1,
+        concurrency: int = 5,
+        unordered: bool = False,
     ) -> AsyncGenerator[PeopleSearch, None]:
         """Returns an asynchronous generator for people search results based on the given options through multiple pages
-        of results. It stops at the first empty results page.
+        of results. It stops after the last page with results, without yielding empty pages.
 
         Can only iterate forwards, to reliably prevent requests to nonexistent pages from looping for longer than
         necessary.
@@ -287,6 +458,10 @@ class Client:
             The stopping page, which won't be included in the final result. By default 2.
         step: :class:`int`, optional
             The step size through which to iterate through the pages. By default 1.
+        concurrency: :class:`int`, optional
+            The maximum number of pages to request at once, capped at 10. By default 5.
+        unordered: :class:`bool`, optional
+            Whether to yield pages as soon as they arrive instead of in page order. By default False.
 
         Yields
         ------
@@ -297,17 +472,27 @@ class Client:
         ------
         RuntimeError
             The start, stop, and step aren't configured for forward iteration.
+        ValueError
+            The concurrency is less than 1.
         """
 
-        if stop < start or step < 1:
-            msg = "Please specify your start, stop, and step such that you only iterate forwards."
-            raise RuntimeError(msg)
-
-        for page_num in range(start, stop, step):
-            page_results = await self.search_people(page_num, any_field, names, fandoms)
-            yield page_results
-            if len(page_results.results) < 20:
-                break
+        options = PeopleSearchOptions(start, any_field, names or [], fandoms or [])
+        query = options.to_dict()
+        return self._search_pages(
+            lambda page_num: self._fetch_search_page(
+                PeopleSearch,
+                self._http.search_people,
+                options,
+                query,
+                page_num,
+            ),
+            start,
+            stop,
+            step,
+            concurrency,
+            unordered,
+            20,
+        )
 
     async def search_bookmarks(self, options: BookmarkSearchOptions) -> BookmarkSearch:
         """Search for bookmarks based in the given options.
@@ -324,19 +509,21 @@ class Client:
         """
 
         text = await self._http.search_bookmarks(**options.to_dict())
-        element = html.fromstring(text)
+        element = await _parse_html_off_loop(text)
         payload = {"_search_options": options}
         return BookmarkSearch(self._http, payload=payload, element=element)
 
-    async def bookmark_search_pages(
+    def bookmark_search_pages(
         self,
         options: BookmarkSearchOptions,
         start: int = 1,
         stop: int = 2,
         step: int = 1,
+        concurrency: int = 5,
+        unordered: bool = False,
     ) -> AsyncGenerator[BookmarkSearch, None]:
         """Returns an asynchronous generator for bookmark search results based on the given options through multiple
-        pages of results. It stops at the first empty results page.
+        pages of results. It stops after the last page with results, without yielding empty pages.
 
         Can only iterate forwards, to reliably prevent requests to nonexistent pages from looping for longer than
         necessary.
@@ -351,6 +538,10 @@ class Client:
             The stopping page, which won't be included in the final result. By default 2.
         step: :class:`int`, optional
             The step size through which to iterate through the pages. By default 1.
+        concurrency: :class:`int`, optional
+            The maximum number of pages to request at once, capped at 10. By default 5.
+        unordered: :class:`bool`, optional
+            Whether to yield pages as soon as they arrive instead of in page order. By default False.
 
         Yields
         ------
@@ -361,18 +552,26 @@ class Client:
         ------
         RuntimeError
             The start, stop, and step aren't configured for forward iteration.
+        ValueError
+            The concurrency is less than 1.
         """
 
-        if stop < start or step < 1:
-            msg = "Please specify your start, stop, and step such that you only iterate forwards."
-            raise RuntimeError(msg)
-
-        for page_num in range(start, stop, step):
-            options.page = page_num
-            page_results = await self.search_bookmarks(options)
-            yield page_results
-            if len(page_results.results) < 20:
-                break
+        query = options.to_dict()
+        return self._search_pages(
+            lambda page_num: self._fetch_search_page(
+                BookmarkSearch,
+                self._http.search_bookmarks,
+                options,
+                query,
+                page_num,
+            ),
+            start,
+            stop,
+            step,
+            concurrency,
+            unordered,
+            20,
+        )
 
     async def search_tags(self, options: TagSearchOptions) -> TagSearch:
         """Search for tags based in the given options.
@@ -388,20 +587,22 @@ class Client:
             A search result object.
         """
 
-        text = await self._http.search_people(**options.to_dict())
-        element = html.fromstring(text)
+        text = await self._http.search_tags(**options.to_dict())
+        element = await _parse_html_off_loop(text)
         payload = {"_search_options": options}
         return TagSearch(self._http, payload=payload, element=element)
 
-    async def tag_search_pages(
+    def tag_search_pages(
         self,
         options: TagSearchOptions,
         start: int = 1,
         stop: int = 2,
         step: int = 1,
+        concurrency: int = 5,
+        unordered: bool = False,
     ) -> AsyncGenerator[TagSearch, None]:
         """Returns an asynchronous generator for tag search results based on the given options through multiple pages of
-        results. It stops at the first empty results page.
+        results. It stops after the last page with results, without yielding empty pages.
 
         Can only iterate forwards, to reliably prevent requests to nonexistent pages from looping for longer than
         necessary.
@@ -416,6 +617,10 @@ class Client:
             The stopping page, which won't be included in the final result. By default 2.
         step: :class:`int`, optional
             The step size through which to iterate through the pages. By default 1.
+        concurrency: :class:`int`, optional
+            The maximum number of pages to request at once, capped at 10. By default 5.
+        unordered: :class:`bool`, optional
+            Whether to yield pages as soon as they arrive instead of in page order. By default False.
 
         Yields
         ------
@@ -426,15 +631,17 @@ class Client:
         ------
         RuntimeError
             The start, stop, and step aren't configured for forward iteration.
+        ValueError
+            The concurrency is less than 1.
         """
 
-        if stop < start or step < 1:
-            msg = "Please specify your start, stop, and step such that you only iterate forwards."
-            raise RuntimeError(msg)
-
-        for page_num in range(start, stop, step):
-            options.page = page_num
-            page_results = await self.search_tags(options)
-            yield page_results
-            if len(page_results.results) < 50:
-                break
+        query = options.to_dict()
+        return self._search_pages(
+            lambda page_num: self._fetch_search_page(TagSearch, self._http.search_tags, options, query, page_num),
+            start,
+            stop,
+            step,
+            concurrency,
+            unordered,
+            50,
+        )
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from enum import Enum
+from collections.abc import Mapping
+from enum import Enum, IntEnum
+from types import MappingProxyType
+from typing import Final
 
 
 __all__ = (
@@ -12,7 +15,7 @@ __all__ = (
 )
 
 
-class RatingId(Enum):
+class RatingId(IntEnum):
     NOT_RATED = 9
     GENERAL_AUDIENCES = 10
     TEEN_AND_UP = 11
@@ -20,7 +23,7 @@ class RatingId(Enum):
     EXPLICIT = 13
 
 
-class ArchiveWarningId(Enum):
+class ArchiveWarningId(IntEnum):
     NOT_WARNED = 14
     VIOLENCE = 17
     MAJOR_DEATH = 18
@@ -29,7 +32,7 @@ class ArchiveWarningId(Enum):
     UNDERAGE = 20
 
 
-class CategoryId(Enum):
+class CategoryId(IntEnum):
     FF = 116
     FM = 22
     GEN = 21
@@ -117,15 +120,13 @@ class Language(Enum):
 
     @classmethod
     def _missing_(cls, value: object) -> Language:
-        try:
-            value = str(value).casefold()
-            for member in cls:
-                if member.value.casefold() == value:
-                    return member
-        except ValueError:
-            return cls.UNKNOWN
-        else:
-            return cls.UNKNOWN
+        return _LANGUAGE_CASEFOLD_INDEX.get(str(value).casefold(), cls.UNKNOWN)
+
+
+# Lets Language() match values regardless of case without scanning every member on each miss.
+_LANGUAGE_CASEFOLD_INDEX: Final[Mapping[str, Language]] = MappingProxyType(
+    {member.value.casefold(): member for member in Language},
+)
 
 
 class FandomKey(Enum):
@@ -26,6 +26,8 @@ AO3_AUTH_ERROR_URL = "https://archiveofourown.org/auth_error"
 class AO3Exception(Exception):
     """Base exception for AO3."""
 
+    __slots__ = ()
+
 
 class HTTPException(AO3Exception):
     """Exception that's raised when something goes wrong during an HTTP request.
@@ -47,44 +49,58 @@ class HTTPException(AO3Exception):
         The message accompanying this error that will be part of the error display.
     """
 
+    __slots__ = ("response", "status", "text")
+
     def __init__(self, response: ClientResponse, message: str | None = None) -> None:
         self.response = response
         self.status = response.status
         self.text = message or ""
+        super().__init__(response, message)
 
-        new_message = f"{response.status} {response.reason or ''}"
+    def __str__(self) -> str:
+        # Built on demand, since most of these are caught and handled without ever being displayed.
+        message = f"{self.status} {self.response.reason or ''}"
         if self.text:
-            new_message += f": {self.text}"
-
-        super().__init__(new_message)
+            message += f": {self.text}"
+        return message
 
 
 class LoginFailure(AO3Exception):
     """Exception that's raised when an attempt to log in to AO3 fails."""
 
+    __slots__ = ()
+
 
 class UnloadedError(AO3Exception):
     """Exception that's raised when the content of an AO3 object hasn't been loaded, but accessing it was attempted."""
 
+    __slots__ = ()
+
+    _DEFAULT_MESSAGE = "._element for this object was never loaded, and thus has nothing to pull from."
+
     def __init__(self, message: str | None = None) -> None:
-        message = message or "._element for this object was never loaded, and thus has nothing to pull from."
-        super().__init__(message)
+        super().__init__(message or self._DEFAULT_MESSAGE)
 
 
 class AuthError(AO3Exception):
     """Exception that's raised when the authentication token for the AO3 session is invalid."""
 
+    __slots__ = ()
+
+    _DEFAULT_MESSAGE = (
+        "Valid authenticity token for this model can't be found. If you're sure you don't need to be logged in to "
+        "perform this action, try again after reloading the model."
+    )
+
     def __init__(self, message: str | None = None) -> None:
-        message = message or (
-            "Valid authenticity token for this model can't be found. If you're sure you don't need to be logged in to "
-            "perform this action, try again after reloading the model."
-        )
-        super().__init__(message)
+        super().__init__(message or self._DEFAULT_MESSAGE)
 
 
 class PseudError(AO3Exception):
     """Exception that's raised when a pseud's ID couldn't be found."""
 
+    __slots__ = ()
+
     def __init__(self, pseud: str | None = None) -> None:
         actual_pseud = f'pseud "{pseud}"' if pseud else "your default pseud"
         message = f"The ID for {actual_pseud} could not be found."
@@ -94,42 +110,60 @@ class PseudError(AO3Exception):
 class KudoError(AO3Exception):
     """Exception that's raised when attempting to give a kudo fails."""
 
+    __slots__ = ()
+
+    _DEFAULT_MESSAGE = "Unknown error coccured while attempting to give kudos to this item."
+
     def __init__(self, message: str | None = None) -> None:
-        message = message or "Unknown error coccured while attempting to give kudos to this item."
-        super().__init__(message)
+        super().__init__(message or self._DEFAULT_MESSAGE)
 
 
 class BookmarkError(AO3Exception):
     """Exception that's raised when attempting to create or access a bookmark fails."""
 
+    __slots__ = ()
+
+    _DEFAULT_MESSAGE = "Unknown error coccured while attempting to bookmark this item."
+
     def __init__(self, message: str | None = None) -> None:
-        message = message or "Unknown error coccured while attempting to bookmark this item."
-        super().__init__(message)
+        super().__init__(message or self._DEFAULT_MESSAGE)
 
 
 class SubscribeError(AO3Exception):
     """Exception that's raised when attempting to create or access a subscription fails."""
 
+    __slots__ = ()
+
+    _DEFAULT_MESSAGE = "Unknown error coccured while attempting to subscribe to this item."
+
     def __init__(self, message: str | None = None) -> None:
-        message = message or "Unknown error coccured while attempting to subscribe to this item."
-        super().__init__(message)
+        super().__init__(message or self._DEFAULT_MESSAGE)
 
 
 class CollectError(AO3Exception):
     """Exception that's raised when attempting to invite a work to a collection fails."""
 
+    __slots__ = ()
+
+    _DEFAULT_MESSAGE = "Unknown error coccured while attempting to collect this item."
+
     def __init__(self, message: str | None = None) -> None:
-        message = message or "Unknown error coccured while attempting to collect this item."
-        super().__init__(message)
+        super().__init__(message or self._DEFAULT_MESSAGE)
 
 
 class InvalidURLError(AO3Exception):
     """Exception that's raised when an invalid AO3 url was passed in."""
 
+    __slots__ = ()
+
 
 class DownloadError(AO3Exception):
     """Exception that's raised when downloading an AO3 work fails."""
 
+    __slots__ = ()
+
 
 class DuplicateCommentError(AO3Exception):
     """Exception that's raised when attempting to post a comment that already exists."""
+
+    __slots__ = ()
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import logging
+import random
 import sys
-from collections.abc import Coroutine, Sequence
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Coroutine, Sequence
 from importlib.metadata import version as im_version
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
-from urllib.parse import quote as uriquote
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast, overload
+from urllib.parse import quote as uriquote, urlencode
 
 import aiohttp
+from yarl import URL
 
 from .errors import AuthError, HTTPException, LoginFailure
-from .utils import extract_login_auth_token
+from .utils import extract_csrf_token, extract_login_auth_token
 
 
 if TYPE_CHECKING:
@@ -22,13 +27,39 @@ else:
 
 T = TypeVar("T")
 Coro = Coroutine[Any, Any, T]
-HTTPMethod = Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
+HTTPMethod = Literal["GET", "HEAD", "POST", "PUT", "DELETE", "PATCH"]
 
 LOGGER = logging.getLogger(__name__)
 
 __all__ = ("HTTPClient",)
 
 AO3_BASE_URL = "https://archiveofourown.org"
+_AO3_BASE_URL = URL(AO3_BASE_URL)
+
+# How long, in seconds, a logged-in session's token is trusted before it's fetched again, and how long before that
+# deadline a refresh already kicks in.
+_AUTH_TOKEN_TTL = 3600.0
+_AUTH_TOKEN_MARGIN = 30.0
+
+# Retry delays grow exponentially from the base up to the cap, with up to a second of random jitter added so that
+# concurrent requests that failed together don't all retry at the same moment. Ratelimit waits asked for by AO3 are
+# honored up to a limit. A request is given up on after a fixed number of attempts.
+_RETRY_BASE = 1.0
+_RETRY_CAP = 30.0
+_RETRY_JITTER = 1.0
+_MAX_RETRY_AFTER = 120.0
+_MAX_TRIES = 5
+# Server-side failures that are usually gone by the next attempt.
+_RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+
+# How many bodies of anonymous GETs are kept for reuse at most, and how long those of AO3's reference listings (the
+# languages and the fandoms in each category), which change very rarely, may be reused for.
+_RESPONSE_CACHE_MAXSIZE = 128
+_REFERENCE_CACHE_TTL = 3600.0
+
+
+def _backoff(tries: int, floor: float = 0.0) -> float:
+    return max(floor, min(_RETRY_CAP, _RETRY_BASE * 2**tries)) + random.uniform(0, _RETRY_JITTER)
 
 
 class Route:
@@ -43,7 +74,8 @@ class Route:
     **parameters: object
         Special keyword arguments that will be substituted into the corresponding spot in the `path` where the key is
         present, e.g. if your parameters are ``user_id=1234`` and your path is ``"user/{user_id}/profile"``, the path
-        will become ``"user/1234/profile"``.
+        will become ``"user/1234/profile"``. Each one fills in a single path segment, so string values are fully
+        percent-encoded, slashes included.
     """
 
     __slots__ = ("verb", "path", "url")
@@ -51,49 +83,211 @@ class Route:
     def __init__(self, verb: HTTPMethod, path: str, **parameters: object) -> None:
         self.verb = verb
         self.path = path
-        url = AO3_BASE_URL + path
+        # aiohttp takes a yarl URL as-is instead of parsing a string. yarl percent-encodes a plain path as it's set, but
+        # it'd leave slashes in parameters alone, so those are quoted here instead.
         if parameters:
-            url = url.format_map({k: uriquote(v) if isinstance(v, str) else v for k, v in parameters.items()})
-        self.url = url
+            path = path.format_map(
+                {k: uriquote(v, safe="") if isinstance(v, str) else v for k, v in parameters.items()}
+            )
+            self.url = _AO3_BASE_URL.with_path(path, encoded=True)
+        else:
+            self.url = _AO3_BASE_URL.with_path(path)
+
+
+@functools.lru_cache(maxsize=64)
+def _static_route(verb: HTTPMethod, path: str) -> Route:
+    # Routes without parameters come out the same every time, so share one instance per endpoint.
+    return Route(verb, path)
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_query_items(items: tuple[tuple[str, object], ...]) -> str:
+    return urlencode(items, doseq=True, quote_via=uriquote)
+
+
+def _encode_search_query(payload: dict[str, object], always: str) -> str:
+    # Paginated searches send the same filters over and over with only the page changing, so the filters are encoded
+    # once and the page number is tacked on in front. Sequences become tuples so that they can be part of the cache key.
+    # Filters that weren't given at all (None, "", or no items) are treated by AO3 the same as missing ones, so they're
+    # left out. The `always` key is sent regardless: without any of a search's keys, AO3 shows the blank search form
+    # instead of results.
+    page = payload.pop("page")
+    items: list[tuple[str, object]] = []
+    for key, raw_val in payload.items():
+        val = tuple(cast("Sequence[object]", raw_val)) if isinstance(raw_val, (list, tuple)) else raw_val
+        if val is None or val == "" or val == ():
+            if key == always:
+                items.append((key, ""))
+        else:
+            items.append((key, val))
+    return f"page={page}&{_encode_query_items(tuple(items))}"
 
 
 class AuthState:
     __slots__ = (
         "login_token",
         "client_user",
+        "token_expires_at",
+        "token_lock",
     )
 
     def __init__(self, login_token: str, client_user: User) -> None:
         self.login_token = login_token
         self.client_user = client_user
+        self.token_expires_at = time.monotonic() + _AUTH_TOKEN_TTL
+        # Held while the token is being refreshed, so that concurrent actions wait on one refresh instead of each
+        # starting their own.
+        self.token_lock = asyncio.Lock()
 
 
 class HTTPClient:
     """A small HTTP client that sends requests to AO3."""
 
     __slots__ = (
+        "_connector",
+        "_inflight",
+        "_max_concurrency",
+        "_owns_session",
+        "_response_cache",
+        "_semaphore",
         "_session",
+        "_warm_up_task",
         "state",
         "user_agent",
     )
 
-    def __init__(self, *, _session: aiohttp.ClientSession | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        _session: aiohttp.ClientSession | None = None,
+        _connector: aiohttp.BaseConnector | None = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1."
+            raise ValueError(msg)
+
         self._session = _session
+        # A session handed in from outside belongs to the caller, who may be sharing it, so it's never closed here.
+        # The same goes for a connector, which is only used if a session has to be created.
+        self._owns_session = _session is None
+        self._connector = _connector
+        # Caps how many requests are out at once across everything sharing this client, so that bursts queue up here
+        # instead of running into AO3's ratelimit. Made on first use, inside the event loop it'll be used in.
+        self._max_concurrency = max_concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        # Bodies of anonymous GETs by (url, return type), along with when they expire. Kept in least- to most-recently
+        # used order.
+        self._response_cache: dict[tuple[URL, str], tuple[float, str | bytes]] = {}
+        # Tasks for GETs currently in flight, by what identifies the request.
+        self._inflight: dict[tuple[object, ...], asyncio.Future[Any]] = {}
+        self._warm_up_task: asyncio.Task[None] | None = None
         user_agent = "bot: ao3.py (https://github.com/Sachaa-Thanasius/ao3.py) {0} Python/{1[0]}.{1[1]} aiohttp/{2}"
         self.user_agent = user_agent.format(im_version("ao3.py"), sys.version_info, im_version("aiohttp"))
         self.state: AuthState | None = None
 
-    def _start_session(self) -> None:
-        if (not self._session) or self._session.closed:
-            self._session = aiohttp.ClientSession()
+    @property
+    def client_user(self) -> User | None:
+        return self.state.client_user if self.state else None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        session = self._session
+        if session is None or session.closed:
+            headers = {"User-Agent": self.user_agent}
+            if self._connector is not None:
+                session = aiohttp.ClientSession(connector=self._connector, connector_owner=False, headers=headers)
+            else:
+                # Nearly every request goes to the same host, so keep connections (and their TLS sessions) alive for
+                # reuse instead of renegotiating them, and don't re-resolve AO3's address every time. The semaphore
+                # already bounds how many requests are out, so the pool doesn't cap them further; downloads that are
+                # still being read hold a connection outside of it and mustn't starve other requests of one. Python
+                # versions before 3.12.7 can leak aborted SSL transports, which aiohttp cleans up when asked.
+                connector = aiohttp.TCPConnector(
+                    limit=0,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=sys.version_info < (3, 12, 7),
+                )
+                session = aiohttp.ClientSession(connector=connector, headers=headers)
+            self._session = session
+            self._owns_session = True
+        return session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        semaphore = self._semaphore
+        if semaphore is None:
+            semaphore = self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return semaphore
+
+    def warm_up(self) -> None:
+        """Start opening a connection to AO3 in the background, if no session has been started yet.
+
+        The first request otherwise pays for the TCP and TLS handshakes itself. This lets that happen while the caller
+        is still busy with other things, and the connection is then reused from the pool.
+        """
+
+        if self._warm_up_task is None and (self._session is None or self._session.closed):
+            self._warm_up_task = asyncio.get_running_loop().create_task(self._warm_up())
+
+    async def _warm_up(self) -> None:
+        session = self._get_session()
+        route = _static_route("HEAD", "/")
+        kwargs: dict[str, Any] = {"allow_redirects": False}
+        self._prepare(route, kwargs)
+        try:
+            async with self._get_semaphore(), session.request(route.verb, route.url, **kwargs):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Nothing depends on this; the first real request will just open its own connection.
+            LOGGER.debug("Failed to warm up a connection to AO3.", exc_info=True)
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
 
+    def _get_cached_response(self, key: tuple[URL, str]) -> str | bytes | None:
+        cache = self._response_cache
+        if (entry := cache.pop(key, None)) and entry[0] > time.monotonic():
+            cache[key] = entry
+            return entry[1]
+        return None
+
+    def _cache_response(self, key: tuple[URL, str], body: str | bytes, ttl: float) -> None:
+        cache = self._response_cache
+        cache.pop(key, None)
+        cache[key] = (time.monotonic() + ttl, body)
+        if len(cache) > _RESPONSE_CACHE_MAXSIZE:
+            del cache[next(iter(cache))]
+
+    def _prepare(self, route: Route, kwargs: dict[str, Any]) -> None:
+        # Fill in the headers shared by _request() and _stream(), in place.
+        headers: dict[str, str] | None = kwargs.get("headers")
+        state = self.state
+        if state and (headers is None or "authenticity_token" not in headers):
+            headers = {} if headers is None else headers
+            if (data := kwargs.get("data")) and "x-csrf-token" in data:
+                headers["authenticity_token"] = data["x-csrf-token"]
+            else:
+                headers["authenticity_token"] = state.login_token
+        if not self._owns_session:
+            # Sessions created here send the User-Agent by default, but one supplied by the caller doesn't.
+            headers = {} if headers is None else headers
+            headers["User-Agent"] = self.user_agent
+        if headers is not None:
+            kwargs["headers"] = headers
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Current request headers: %s", headers)
+            LOGGER.debug("Current request url: %s", route.url)
+
     @overload
     async def _request(self, route: Route, return_type: Literal["text"] = ..., **kwargs: Any) -> str: ...
 
+    @overload
+    async def _request(self, route: Route, return_type: Literal["bytes"] = ..., **kwargs: Any) -> bytes: ...
+
     @overload
     async def _request(self, route: Route, return_type: Literal["json"] = ..., **kwargs: Any) -> dict[str, object]: ...
 
@@ -116,60 +310,120 @@ class HTTPClient:
     async def _request(
         self,
         route: Route,
-        return_type: Literal["text", "json", "raw", "both"] = "text",
+        return_type: Literal["text", "bytes", "json", "raw", "both"] = "text",
+        *,
+        cache_ttl: float | None = None,
+        query: str | None = None,
         **kwargs: Any,
-    ) -> str | dict[str, object] | aiohttp.ClientResponse | tuple[aiohttp.ClientResponse, str]:
-        self._start_session()
-        assert self._session
-
-        headers = kwargs.pop("headers", {})
-        if self.state and ("authenticity_token" not in headers):
-            if kwargs["data"] and "x-csrf-token" in kwargs["data"]:
-                headers["authenticity_token"] = kwargs["data"]["x-csrf-token"]
-            else:
-                headers["authenticity_token"] = self.state.login_token
-        headers["User-Agent"] = self.user_agent
-        kwargs["headers"] = headers
-
-        LOGGER.debug("Current request headers: %s", headers)
-        LOGGER.debug("Current request url: %s", route.url)
+    ) -> str | bytes | dict[str, object] | aiohttp.ClientResponse | tuple[aiohttp.ClientResponse, str]:
+        # Endpoints can opt into having their bodies reused for as long as they say. That's limited to plain GETs made
+        # while logged out, which get the same page as anyone else would; anything with a query, a body, or custom
+        # headers, or made while logged in, always goes out.
+        cache_key = None
+        if (
+            cache_ttl is not None
+            and route.verb == "GET"
+            and return_type in {"text", "bytes"}
+            and query is None
+            and not kwargs
+            and self.state is None
+        ):
+            cache_key = (route.url, return_type)
+            if (body := self._get_cached_response(cache_key)) is not None:
+                return body
+
+        # Identical GETs that are already in flight are joined instead of being sent again. That's limited to bodies
+        # that can be shared as-is, and to requests with nothing beyond a query, so that it's clear they're the same.
+        inflight_key = None
+        if route.verb == "GET" and return_type in {"text", "bytes"} and kwargs.keys() <= {"params"}:
+            params = kwargs.get("params")
+            inflight_key = (route.url, query, tuple(params.items()) if params else (), return_type, self.state)
+            if (pending := self._inflight.get(inflight_key)) is not None:
+                return await asyncio.shield(pending)
+
+        self._prepare(route, kwargs)
+
+        # An already-encoded query string has to be marked as such, or it'll be quoted a second time.
+        url = route.url if query is None else URL(f"{route.url}?{query}", encoded=True)
+
+        if inflight_key is None:
+            return await self._send(route, url, return_type, cache_key, cache_ttl, kwargs)
+
+        # The request runs as its own task, so that one caller giving up doesn't cancel it for the others.
+        task = asyncio.ensure_future(self._send(route, url, return_type, cache_key, cache_ttl, kwargs))
+        self._inflight[inflight_key] = task
+        task.add_done_callback(functools.partial(self._forget_inflight, inflight_key))
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: tuple[object, ...], task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # If every caller was cancelled in the meantime, nobody is left to see the outcome.
+        if not task.cancelled():
+            task.exception()
+
+    async def _send(
+        self,
+        route: Route,
+        url: URL,
+        return_type: Literal["text", "bytes", "json", "raw", "both"],
+        cache_key: tuple[URL, str] | None,
+        cache_ttl: float | None,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        # The actual request and retry loop behind _request().
+        session = self._get_session()
+        semaphore = self._get_semaphore()
 
         response: aiohttp.ClientResponse | None = None
-        for tries in range(5):
+        for tries in range(_MAX_TRIES):
             try:
-                async with self._session.request(route.verb, route.url, **kwargs) as response:
-                    retry = response.headers.get("retry-after", None)
-                    LOGGER.debug("retry is: %s", retry)
-                    if retry is not None:
-                        retry = int(retry)
-
+                async with semaphore, session.request(route.verb, url, **kwargs) as response:
                     if 200 <= response.status < 300 or response.status == 302:
+                        # AO3 always serves UTF-8, so name the encoding instead of having aiohttp sniff for it. A stray
+                        # invalid byte in user-submitted content shouldn't sink the whole page, so it's replaced.
                         if return_type == "text":
-                            return await response.text()
-                        if return_type == "json":
-                            return await response.json()
-                        if return_type == "both":
-                            return (response, await response.text())
-                        return response
+                            body = await response.text(encoding="utf-8", errors="replace")
+                        elif return_type == "bytes":
+                            body = await response.read()
+                        elif return_type == "json":
+                            return await response.json(encoding="utf-8")
+                        elif return_type == "both":
+                            return (response, await response.text(encoding="utf-8", errors="replace"))
+                        else:
+                            return response
+
+                        if cache_key is not None and cache_ttl is not None and response.status == 200:
+                            self._cache_response(cache_key, body, cache_ttl)
+                        return body
 
                     if response.status == 429:
-                        assert retry is not None
-                        delta = retry + 1
-                        LOGGER.warning("A ratelimit has been hit, sleeping for: %d", delta)
-                        await asyncio.sleep(delta)
-                        continue
-
-                    if response.status in {500, 502, 503, 504}:
-                        sleep_ = 1 + tries * 2
-                        LOGGER.warning("Hit an API error, trying again in: %d", sleep_)
-                        await asyncio.sleep(sleep_)
-                        continue
-
-                    LOGGER.exception("Unhandled HTTP error occured: %s -> %s", response.status, response)
-                    raise HTTPException(response, "Unhandled HTTP error occured")
+                        retry = response.headers.get("retry-after", None)
+                        if LOGGER.isEnabledFor(logging.DEBUG):
+                            LOGGER.debug("retry is: %s", retry)
+                        retry_after = 0.0
+                        if retry is not None:
+                            try:
+                                retry_after = min(float(retry), _MAX_RETRY_AFTER)
+                            except ValueError:
+                                # Given as an HTTP date instead of a number of seconds.
+                                pass
+                        # AO3's wait is a floor; repeated ratelimits still back off further than it asks.
+                        delay = _backoff(tries, retry_after)
+                        LOGGER.warning("A ratelimit has been hit, sleeping for: %.2f", delay)
+                    elif response.status in _RETRYABLE_STATUSES:
+                        delay = _backoff(tries)
+                        LOGGER.warning("Hit an API error, trying again in: %.2f", delay)
+                    else:
+                        LOGGER.exception("Unhandled HTTP error occured: %s -> %s", response.status, response)
+                        raise HTTPException(response, "Unhandled HTTP error occured")
             except (aiohttp.ServerDisconnectedError, aiohttp.ServerTimeoutError):
                 LOGGER.exception("Network error occured")
-                await asyncio.sleep(5)
+                delay = _backoff(tries)
+
+            # Only wait once the response and its slot in the semaphore have been let go of, so that a backoff doesn't
+            # hold up every other request on this client while it sleeps.
+            await asyncio.sleep(delay)
 
         if response is not None:
             raise HTTPException(response=response)
@@ -177,40 +431,34 @@ class HTTPClient:
         msg = "Unreachable code in HTTP handling."
         raise RuntimeError(msg)
 
-    async def _stream(self, route: Route, **kwargs: Any) -> aiohttp.StreamReader:
-        self._start_session()
-        assert self._session
-
-        headers = kwargs.pop("headers", {})
-        if self.state and ("authenticity_token" not in headers):
-            if kwargs["data"] and "x-csrf-token" in kwargs["data"]:
-                headers["authenticity_token"] = kwargs["data"]["x-csrf-token"]
-            else:
-                headers["authenticity_token"] = self.state.login_token
-        headers["User-Agent"] = self.user_agent
-        kwargs["headers"] = headers
+    @contextlib.asynccontextmanager
+    async def _stream(self, route: Route, **kwargs: Any) -> AsyncGenerator[aiohttp.StreamReader, None]:
+        # The body can only be read while the response is open, so hand out its stream from inside the request instead
+        # of after it has already been released.
+        session = self._get_session()
+        semaphore = self._get_semaphore()
 
-        LOGGER.debug("Current request headers: %s", headers)
-        LOGGER.debug("Current request url: %s", route.url)
+        self._prepare(route, kwargs)
 
-        try:
-            async with self._session.request(route.verb, route.url, **kwargs) as response:
-                return response.content
-        except (aiohttp.ServerDisconnectedError, aiohttp.ServerTimeoutError):
-            LOGGER.exception("Network error occured")
-            await asyncio.sleep(5)
+        # The concurrency slot only covers getting the response, so that a caller reading the body slowly (or never
+        # finishing) doesn't keep other requests waiting on it.
+        async with semaphore:
+            response = await session.request(route.verb, route.url, **kwargs)
 
-        msg = "Unreachable code in HTTP handling."
-        raise RuntimeError(msg)
+        async with response:
+            if not 200 <= response.status < 300:
+                LOGGER.error("Unhandled HTTP error occured while streaming: %s -> %s", response.status, response)
+                raise HTTPException(response, "Unhandled HTTP error occured")
+            yield response.content
 
-    async def login(self, username: str, password: str) -> tuple[str | None, str]:
+    async def login(self, username: str, password: str) -> tuple[str | None, bytes]:
         # Get the login page.
-        route = Route("GET", "/users/login")
+        route = _static_route("GET", "/users/login")
         text = await self._request(route)
         token = extract_login_auth_token(text)
 
         # Perform the login.
-        route = Route("POST", "/users/login")
+        route = _static_route("POST", "/users/login")
         payload = {"user[login]": username, "user[password]": password, "authenticity_token": token}
         resp, text = await self._request(route, return_type="both", params=payload, allow_redirects=False)
         if resp.status != 302:
@@ -218,94 +466,123 @@ class HTTPClient:
 
         return extract_login_auth_token(text), await self.get_user(username)
 
+    async def get_auth_token(self) -> str | None:
+        """Returns the logged-in session's authenticity token, fetching a fresh one if it's about to expire.
+
+        Returns
+        -------
+        :class:`str` | None
+            The token, or None if not logged in.
+        """
+
+        state = self.state
+        if state is None:
+            return None
+        if time.monotonic() < state.token_expires_at - _AUTH_TOKEN_MARGIN:
+            return state.login_token
+
+        async with state.token_lock:
+            # Someone else may have refreshed it while this was waiting on the lock.
+            if time.monotonic() < state.token_expires_at - _AUTH_TOKEN_MARGIN:
+                return state.login_token
+
+            text = await self._request(_static_route("GET", "/"))
+            if token := extract_csrf_token(text):
+                state.login_token = token
+            state.token_expires_at = time.monotonic() + _AUTH_TOKEN_TTL
+        return state.login_token
+
     async def logout(self) -> None:
-        route = Route("POST", "/users/logout")
+        route = _static_route("POST", "/users/logout")
         data = {"_method": "delete"}
         await self._request(route, data=data)
-        if self.state:
-            del self.state
+        self.state = None
 
-    def get_languages(self) -> Coro[str]:
-        route = Route("GET", "/languages")
-        return self._request(route)
+    def get_languages(self) -> Coro[bytes]:
+        route = _static_route("GET", "/languages")
+        return self._request(route, return_type="bytes", cache_ttl=_REFERENCE_CACHE_TTL)
 
-    def get_fandoms(self, fandom_key: str) -> Coro[str]:
+    def get_fandoms(self, fandom_key: str) -> Coro[bytes]:
         route = Route("GET", "/media/{key}/fandoms", key=fandom_key)
-        return self._request(route)
+        return self._request(route, return_type="bytes", cache_ttl=_REFERENCE_CACHE_TTL)
 
-    def get_user(self, username: str) -> Coro[str]:
+    def get_user(self, username: str) -> Coro[bytes]:
         # Going straight for the profile instead of parsing from the dashboard makes more sense.
         route = Route("GET", "/users/{username}/profile", username=username)
-        return self._request(route)
+        return self._request(route, return_type="bytes")
 
-    def get_user_profile(self, username: str) -> Coro[str]:
+    def get_user_profile(self, username: str) -> Coro[bytes]:
         route = Route("GET", "/users/{username}/profile", username=username)
-        return self._request(route)
+        return self._request(route, return_type="bytes")
 
-    def get_user_works(self, username: str, page: int = 1) -> Coro[str]:
+    def get_user_works(self, username: str, page: int = 1) -> Coro[bytes]:
         route = Route("GET", "/users/{username}/works", username=username)
         payload = {"page": page}
-        return self._request(route, params=payload)
+        return self._request(route, return_type="bytes", params=payload)
 
-    def get_user_bookmarks(self, username: str, page: int = 1) -> Coro[str]:
+    def get_user_bookmarks(self, username: str, page: int = 1) -> Coro[bytes]:
         route = Route("GET", "/users/{username}/bookmarks", username=username)
         payload = {"page": page}
-        return self._request(route, params=payload)
+        return self._request(route, return_type="bytes", params=payload)
 
-    def get_user_subscriptions(self, username: str, page: int = 1) -> Coro[str]:
+    def get_user_subscriptions(self, username: str, page: int = 1) -> Coro[bytes]:
         route = Route("GET", "/users/{username}/subscriptions", username=username)
         payload = {"page": page}
-        return self._request(route, params=payload)
+        return self._request(route, return_type="bytes", params=payload)
 
     def get_user_history(
         self,
         username: str,
         page: int = 1,
         marked_later: bool = False,
-    ) -> Coro[str]:
+    ) -> Coro[bytes]:
         route = Route("GET", "/users/{username}/readings", username=username)
         payload: dict[str, object] = {"page": page}
         if marked_later:
             payload["show"] = "to-read"
-        return self._request(route, params=payload)
+        return self._request(route, return_type="bytes", params=payload)
 
-    def get_user_work_statistics(self, username: str, year: int | Literal["All Years"]) -> Coro[str]:
+    def get_user_work_statistics(self, username: str, year: int | Literal["All Years"]) -> Coro[bytes]:
         route = Route("GET", "/users/{username}/stats", username=username)
         payload = {"year": year}
-        return self._request(route, params=payload)
+        return self._request(route, return_type="bytes", params=payload)
 
-    def get_work(self, work_id: int, *, load: bool = False) -> Coro[str]:
+    def get_work(self, work_id: int, *, load: bool = False) -> Coro[bytes]:
         route = Route("GET", "/works/{id}", id=work_id)
         payload = {"view_adult": "true"}
         if load:
             payload["view_full_work"] = "true"
-        return self._request(route, params=payload)
+        return self._request(route, return_type="bytes", params=payload)
 
-    def get_work_download_stream(
+    async def get_work_download_stream(
         self,
         work_id: int,
         work_title: str,
         filetype: Literal["AZW3", "EPUB", "MOBI", "PDF", "HTML"],
-    ) -> Coro[aiohttp.StreamReader]:
+    ) -> AsyncIterator[bytes]:
+        # Iterating keeps the response, and with it a pooled connection, open until the whole file has been read or the
+        # generator is closed, so stop early with aclose() rather than leaving it suspended.
         filename = f"{work_title}.{filetype.lower()}"
-        route = Route("GET", "/downloads/{id}/{filename}}", id=work_id, filename=filename)
-        return self._stream(route)
+        route = Route("GET", "/downloads/{id}/{filename}", id=work_id, filename=filename)
+        async with self._stream(route) as content:
+            async for chunk in content.iter_any():
+                yield chunk
 
-    def get_series(self, series_id: int) -> Coro[str]:
+    def get_series(self, series_id: int) -> Coro[bytes]:
         route = Route("GET", "/series/{id}", id=series_id)
-        return self._request(route)
+        return self._request(route, return_type="bytes")
 
     def get_chapter(
         self,
         chapter_id: int,
         show_comments: bool = False,
         comment_page: int = 1,
-    ) -> Coro[str]:
+    ) -> Coro[bytes]:
         route = Route("GET", "/chapters/{id}", id=chapter_id)
         payload: dict[str, object] = {"view_adult": "true"}
         if show_comments:
             payload.update({"show_comments": "true", "comment_page": comment_page})
-        return self._request(route, params=payload)
+        return self._request(route, return_type="bytes", params=payload)
 
     def search_works(
         self,
@@ -333,21 +610,21 @@ class HTTPClient:
         excluded_tag_names: str = "",
         sort_column: str = "_score",
         sort_direction: Literal["asc", "desc"] = "desc",
-    ) -> Coro[str]:
-        route = Route("GET", "/works/search")
+    ) -> Coro[bytes]:
+        route = _static_route("GET", "/works/search")
         payload: dict[str, object] = {
             "page": page,
             "work_search[query]": any_field,
             "work_search[title]": title,
             "work_search[creators]": author,
             "work_search[revised_at]": revised_at,
-            "work_search[complete]": complete if complete is not None else "",
-            "work_search[crossover]": crossover if crossover is not None else "",
+            "work_search[complete]": complete,
+            "work_search[crossover]": crossover,
             "work_search[single_chapter]": int(single_chapter),
             "work_search[word_count]": word_count,
-            "work_search[language_id]": language_id if language_id else "",
+            "work_search[language_id]": language_id,
             "work_search[fandom_names]": fandom_names,
-            "work_search[rating_ids]": rating_ids if rating_ids else "",
+            "work_search[rating_ids]": rating_ids,
             "work_search[character_names]": character_names,
             "work_search[relationship_names]": relationship_names,
             "work_search[freeform_names]": freeform_names,
@@ -357,25 +634,24 @@ class HTTPClient:
             "work_search[bookmarks_count]": bookmarks_count,
             "work_search[sort_column]": sort_column,
             "work_search[sort_direction]": sort_direction,
+            "work_search[archive_warning_ids][]": archive_warning_ids,
+            "work_search[category_ids][]": category_ids,
+            "work_search[excluded_tag_names]": excluded_tag_names,
         }
-        if archive_warning_ids:
-            payload["work_search[archive_warning_ids][]"] = archive_warning_ids
-        if category_ids:
-            payload["work_search[category_ids][]"] = category_ids
-        if excluded_tag_names:
-            payload["work_search[excluded_tag_names]"] = excluded_tag_names
-
-        return self._request(route, params=payload)
-
-    def search_people(self, page: int = 1, any_field: str = "", name: str = "", fandom: str = "") -> Coro[str]:
-        route = Route("GET", "/people/search")
-        payload = {
+
+        query = _encode_search_query(payload, "work_search[query]")
+        return self._request(route, return_type="bytes", query=query)
+
+    def search_people(self, page: int = 1, any_field: str = "", name: str = "", fandom: str = "") -> Coro[bytes]:
+        route = _static_route("GET", "/people/search")
+        payload: dict[str, object] = {
             "page": page,
             "people_search[fandom]": fandom,
             "people_search[name]": name,
             "people_search[query]": any_field,
         }
-        return self._request(route, params=payload)
+        query = _encode_search_query(payload, "people_search[query]")
+        return self._request(route, return_type="bytes", query=query)
 
     def search_bookmarks(
         self,
@@ -393,13 +669,13 @@ class HTTPClient:
         with_notes: bool = False,
         bookmark_date: str = "",
         sort_column: Literal["created_at", "bookmarkable_date"] | None = None,
-    ) -> Coro[str]:
-        route = Route("GET", "/bookmarks/search")
-        payload = {
+    ) -> Coro[bytes]:
+        route = _static_route("GET", "/bookmarks/search")
+        payload: dict[str, object] = {
             "page": page,
             "bookmark_search[bookmarkable_query]": any_field,
             "bookmark_search[other_tag_names]": work_tags,
-            "bookmark_search[bookmarkable_type]": type_ if type_ is not None else "",
+            "bookmark_search[bookmarkable_type]": type_,
             "bookmark_search[language_id]": language_id,
             "bookmark_search[bookmarkable_date]": work_updated,
             "bookmark_search[bookmark_query]": any_bookmark_field,
@@ -409,36 +685,40 @@ class HTTPClient:
             "bookmark_search[rec]": int(recommended),
             "bookmark_search[with_notes]": int(with_notes),
             "bookmark_search[date]": bookmark_date,
-            "bookmark_search[sort_column]": sort_column if sort_column is not None else "",
+            "bookmark_search[sort_column]": sort_column,
         }
-        return self._request(route, params=payload)
+        query = _encode_search_query(payload, "bookmark_search[bookmarkable_query]")
+        return self._request(route, return_type="bytes", query=query)
 
     def search_tags(
         self,
+        page: int = 1,
         name: str = "",
         fandoms: str = "",
         type_: Literal["Fandom", "Character", "Relationship", "Freeform"] | None = None,
         wranging_status: Literal["T", "F"] | None = None,
         sort_column: Literal["name", "created_at"] = "name",
         sort_direction: Literal["asc", "desc"] = "asc",
-    ) -> Coro[str]:
-        route = Route("GET", "/tags/search")
-        payload = {
+    ) -> Coro[bytes]:
+        route = _static_route("GET", "/tags/search")
+        payload: dict[str, object] = {
+            "page": page,
             "tag_search[name]": name,
             "tag_search[fandoms]": fandoms,
-            "tag_search[type]": type_ if type_ is not None else "",
-            "tag_search[canonical]": wranging_status if wranging_status is not None else "",
+            "tag_search[type]": type_,
+            "tag_search[canonical]": wranging_status,
             "tag_search[sort_column]": sort_column,
             "tag_search[sort_direction]": sort_direction,
         }
-        return self._request(route, params=payload)
+        query = _encode_search_query(payload, "tag_search[name]")
+        return self._request(route, return_type="bytes", query=query)
 
-    def get_comment(self, comment_id: str) -> Coro[str]:
+    def get_comment(self, comment_id: str) -> Coro[bytes]:
         route = Route("GET", "/comments/{id}", id=comment_id)
-        return self._request(route)
+        return self._request(route, return_type="bytes")
 
     def give_kudos(self, authenticity_token: str, kudoable_id: int, kudoable_type: str) -> Coro[aiohttp.ClientResponse]:
-        route = Route("POST", "/kudos.js")
+        route = _static_route("POST", "/kudos.js")
         headers = {
             "X-CSRF-Token": authenticity_token,
             "X-Requested-With": "XMLHttpRequest",
@@ -456,19 +736,13 @@ class HTTPClient:
         authenticity_token: str,
         bookmarkable_path: str,
         notes: str = "",
-        tags: list[str] | None = None,
-        collections: list[str] | None = None,
+        tags: Sequence[str] = (),
+        collections: Sequence[str] = (),
         private: bool = False,
         recommend: bool = False,
         pseud_id: str = "",
     ) -> Coro[aiohttp.ClientResponse]:
-        route = Route("POST", "{bookmarkable_path}/bookmarks", bookmarkable_path=bookmarkable_path)
-
-        if tags is None:
-            tags = []
-        if collections is None:
-            collections = []
-
+        route = Route("POST", f"{bookmarkable_path}/bookmarks")
         data = {
             "authenticity_token": authenticity_token,
             "bookmark[pseud_id]": pseud_id,
@@ -482,7 +756,7 @@ class HTTPClient:
         return self._request(route, return_type="raw", data=data, allow_redirects=False)
 
     def delete_bookmark(self, authenticity_token: str, bookmark_id: int) -> Coro[aiohttp.ClientResponse]:
-        route = Route("POST", "bookmarks/{bookmark_id}", bookmark_id=bookmark_id)
+        route = Route("POST", "/bookmarks/{bookmark_id}", bookmark_id=bookmark_id)
         data = {"authenticity_token": authenticity_token, "_method": "delete"}
         return self._request(route, return_type="raw", data=data)
 
@@ -531,7 +805,7 @@ class HTTPClient:
         pseud: str | None = None,
     ) -> Coro[str]:
         # TODO: Implement post_comment() properly. Currently a stub. Needs authenticity token.
-        route = Route("POST", "/comments.js")
+        route = _static_route("POST", "/comments.js")
         token = getattr(self.state, "login_token", token)
         if not token:
             raise AuthError
@@ -565,7 +839,7 @@ class HTTPClient:
         collectable_path: str,
         collection_names: str,
     ) -> Coro[tuple[aiohttp.ClientResponse, str]]:
-        route = Route("POST", "/{collectable_path}/collection_items", collectable_path=collectable_path)
+        route = Route("POST", f"{collectable_path}/collection_items")
         data = {
             "authenticity_token": authenticity_token,
             "collection_names": collection_names,
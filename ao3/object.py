@@ -38,7 +38,8 @@ class Object:
         The type of the object, which can be any Page subclasses. Defaults to `Object`.
     """
 
-    __slots__ = ("id", "name", "type")
+    __slots__ = ("_hash", "id", "name", "type")
+    __match_args__ = ("id", "name", "type")
 
     def __init__(
         self,
@@ -51,26 +52,44 @@ class Object:
             msg = "At least one of id and name must be specified."
             raise ValueError(msg)
 
-        if id is not None:
+        # Plain ints are by far the most common input, so skip the conversion for them.
+        if id is not None and id.__class__ is not int:
             try:
                 id = int(id)
-            except ValueError:
+            except (TypeError, ValueError):
                 msg = f"id parameter must be int-compatible, not {id.__class__}"
                 raise ValueError(msg) from None
 
         self.id = id
         self.name = name
         self.type = type or self.__class__
+        # Only hash what __eq__ compares; including name and type would let equal objects hash differently.
+        self._hash = hash(id) if id is not None else hash(name)
 
     def __eq__(self, __value: object) -> bool:
-        if isinstance(__value, self.type):
+        if self is __value:
+            return True
+        # Exact type matches are the common case and avoid a full isinstance() check.
+        type_ = self.type
+        if type(__value) is type_ or isinstance(__value, type_):
+            # Only objects that both lack an ID fall back to the name, so that equality stays symmetric and consistent
+            # with __hash__.
+            if self.id is None and __value.id is None:
+                return self.name == getattr(__value, "name", None)
             return self.id == __value.id
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(tuple(attr for attr in (self.id, self.name, self.type) if attr is not None))
+        return self._hash
 
     def __repr__(self) -> str:
-        attrs_ = ("id", "name", "type")
-        resolved = (f"{attr}={val}" for attr in attrs_ if (val := getattr(self, attr)) is not None)
-        return f"{type(self).__name__}({' '.join(resolved)})"
+        parts: list[str] = []
+        if (id := self.id) is not None:
+            parts.append(f"id={id}")
+        if (name := self.name) is not None:
+            parts.append(f"name={name}")
+        # The type defaults to the class itself, which the name in front already says.
+        cls = type(self)
+        if (type_ := self.type) is not cls:
+            parts.append(f"type={type_.__name__}")
+        return f"{cls.__name__}({' '.join(parts)})"
@@ -6,21 +6,22 @@ from abc import abstractmethod
 from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Generic, Literal, Tuple, TypeVar
 
-from lxml import html
-
 from ._selectors import SEARCH_SELECTOR
 from .abc import Page
 from .enums import ArchiveWarningId, CategoryId, Language, RatingId
 from .errors import UnloadedError
 from .object import Object
-from .utils import Constraint, cached_slot_property
+from .utils import _UNSET, Constraint, _parse_html_off_loop, cached_slot_property
 
 
 if TYPE_CHECKING:
+    from lxml import html
+    from typing_extensions import Self
+
     from .http import HTTPClient
     from .work import Work
 else:
-    HTTPClient = Work = object
+    HTTPClient = Self = Work = object
 
 R = TypeVar("R")
 SP = TypeVar("SP", bound="SearchOptions")
@@ -85,6 +86,24 @@ class SearchOptions:
 
         return dataclasses.asdict(self)
 
+    def with_page(self, page: int) -> Self:
+        """Make a copy of these options that points to a different page of results.
+
+        The original options are left untouched, so copies for different pages can be used concurrently.
+
+        Parameters
+        ----------
+        page: :class:`int`
+            The page of the search results to get.
+
+        Returns
+        -------
+        Self
+            The copied options.
+        """
+
+        return dataclasses.replace(self, page=page)
+
 
 @dataclasses.dataclass
 class WorkSearchOptions(SearchOptions):
@@ -223,7 +242,9 @@ class PeopleSearchOptions(SearchOptions):
 
     def to_dict(self) -> dict[str, Any]:
         result = super().to_dict()
-        result.update(names=",".join(self.names), fandoms=",".join(self.fandoms))
+        # HTTPClient.search_people() takes singular parameter names.
+        del result["names"], result["fandoms"]
+        result.update(name=",".join(self.names), fandom=",".join(self.fandoms))
         return result
 
 
@@ -283,6 +304,8 @@ class BookmarkSearchOptions(SearchOptions):
             language_id=self.language_id.name.lower() if self.language_id else "",
             bookmark_tags=",".join(self.bookmark_tags),
         )
+        # "type" is spelled "type_" on the HTTPClient side to avoid shadowing the builtin.
+        result["type_"] = result.pop("type")
         return result
 
 
@@ -317,6 +340,7 @@ class TagSearchOptions(SearchOptions):
     def to_dict(self) -> dict[str, Any]:
         result = super().to_dict()
         result["fandoms"] = ",".join(self.fandoms)
+        result["type_"] = result.pop("type")
         if self.wranging_status is None:
             result.pop("wranging_status")
         else:
@@ -416,12 +440,14 @@ class Search(Page, Generic[SP, R]):
 class WorkSearch(Search[WorkSearchOptions, "Work"]):
     """A page of AO3 work search results."""
 
+    __slots__ = ()
+
     @property
     def full_total(self) -> int:
         if self.raw_element is None:
             raise UnloadedError
         try:
-            return int(str(self.raw_element.cssselect("h3")[1].text).partition(" Found")[0])
+            return int(str(SEARCH_SELECTOR["total"](self.raw_element)[1].text).partition(" Found")[0])
         except (IndexError, ValueError):
             return 0
 
@@ -436,19 +462,21 @@ class WorkSearch(Search[WorkSearchOptions, "Work"]):
 
     async def reload(self) -> None:
         text = await self._http.search_works(**self.search_options.to_dict())
-        self._element = html.fromstring(text)
-        del self._cs_results
+        self._element = await _parse_html_off_loop(text)
+        self._cs_results = _UNSET
 
 
 class PeopleSearch(Search[PeopleSearchOptions, Object]):
     """A page of AO3 people search results."""
 
+    __slots__ = ()
+
     @property
     def full_total(self) -> int:
         if self.raw_element is None:
             raise UnloadedError
         try:
-            el = self.raw_element.cssselect("div.people-search.region p strong")[0]
+            el = SEARCH_SELECTOR["people_total"](self.raw_element)[0]
             return int(str(el.text).partition(" Found")[0])
         except (IndexError, ValueError):
             return 0
@@ -458,25 +486,27 @@ class PeopleSearch(Search[PeopleSearchOptions, Object]):
 
         assert self.raw_element is not None  # Should raise an error before this point if not.
         return tuple(
-            Object(name=str(el.cssselect("h4.heading > a")[0].text_content()), type=User)
+            Object(name=str(SEARCH_SELECTOR["user_link"](el)[0].text_content()), type=User)
             for el in SEARCH_SELECTOR["people"](self.raw_element)
         )
 
     async def reload(self) -> None:
         text = await self._http.search_people(**self.search_options.to_dict())
-        self._element = html.fromstring(text)
-        del self._cs_results
+        self._element = await _parse_html_off_loop(text)
+        self._cs_results = _UNSET
 
 
 class BookmarkSearch(Search[BookmarkSearchOptions, Tuple[Object, "Work"]]):
     """A page of AO3 bookmark search results."""
 
+    __slots__ = ()
+
     @property
     def full_total(self) -> int:
         if self.raw_element is None:
             raise UnloadedError
         try:
-            return int(str(self.raw_element.cssselect("h3")[1].text).partition(" Found")[0])
+            return int(str(SEARCH_SELECTOR["total"](self.raw_element)[1].text).partition(" Found")[0])
         except (IndexError, ValueError):
             return 0
 
@@ -487,7 +517,7 @@ class BookmarkSearch(Search[BookmarkSearchOptions, Tuple[Object, "Work"]]):
         assert self.raw_element is not None  # Should raise an error before this point if not.
         return tuple(
             (
-                Object(name=str(el.cssselect("h4.heading > a")[0].text_content()), type=User),
+                Object(name=str(SEARCH_SELECTOR["user_link"](el)[0].text_content()), type=User),
                 Work._from_banner(self._http, el, self.authenticity_token),
             )
             for el in SEARCH_SELECTOR["bookmark"](self.raw_element)
@@ -495,19 +525,21 @@ class BookmarkSearch(Search[BookmarkSearchOptions, Tuple[Object, "Work"]]):
 
     async def reload(self) -> None:
         text = await self._http.search_bookmarks(**self.search_options.to_dict())
-        self._element = html.fromstring(text)
-        del self._cs_results
+        self._element = await _parse_html_off_loop(text)
+        self._cs_results = _UNSET
 
 
 class TagSearch(Search[TagSearchOptions, TagInfo]):
     """A page of AO3 tag search results."""
 
+    __slots__ = ()
+
     @property
     def full_total(self) -> int:
         if self.raw_element is None:
             raise UnloadedError
         try:
-            return int(str(self.raw_element.cssselect("h3")[1].text).partition(" Found")[0])
+            return int(str(SEARCH_SELECTOR["total"](self.raw_element)[1].text).partition(" Found")[0])
         except (IndexError, ValueError):
             return 0
 
@@ -515,12 +547,12 @@ class TagSearch(Search[TagSearchOptions, TagInfo]):
         assert self.raw_element is not None  # Should raise an error before this point if not.
 
         return tuple(
-            TagInfo(result["type"], result["name"], int(result["count"]), len(el.cssselect("span.canonical")) > 0)
+            TagInfo(result["type"], result["name"], int(result["count"]), len(SEARCH_SELECTOR["canonical"](el)) > 0)
             for el in SEARCH_SELECTOR["tag"](self.raw_element)
             if (result := TAG_SECTIONS.search(str(el.text_content())))
         )
 
     async def reload(self) -> None:
         text = await self._http.search_tags(**self.search_options.to_dict())
-        self._element = html.fromstring(text)
-        del self._cs_results
+        self._element = await _parse_html_off_loop(text)
+        self._cs_results = _UNSET
@@ -4,17 +4,17 @@ import datetime
 from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
-from lxml import html
-
 from ._selectors import SERIES_SELECTORS
 from .abc import BookmarkableMixin, Page, SubscribableMixin
 from .errors import UnloadedError
 from .object import Object
 from .user import User
-from .utils import cached_slot_property, int_or_none
+from .utils import _UNSET, _parse_html_off_loop, cached_slot_property, int_or_none
 
 
 if TYPE_CHECKING:
+    from lxml import html
+
     from .http import HTTPClient
     from .work import Work
 else:
@@ -252,9 +252,9 @@ class Series(Page, BookmarkableMixin, SubscribableMixin):  # type: ignore # Over
 
     async def reload(self) -> None:
         text = await self._http.get_series(self.id)
-        self._element = html.fromstring(text)
+        self._element = await _parse_html_off_loop(text)
 
         # Reset cached properties.
         slots = set(self.__slots__).difference(("_id", "_http", "_element"))
         for attr in slots:
-            delattr(self, attr)
+            setattr(self, attr, _UNSET)
@@ -5,15 +5,15 @@ import re
 from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
-from lxml import html
-
 from ._selectors import USER_SELECTORS
 from .abc import Page, SubscribableMixin
 from .errors import UnloadedError
-from .utils import cached_slot_property
+from .utils import _UNSET, _parse_html_off_loop, cached_slot_property
 
 
 if TYPE_CHECKING:
+    from lxml import html
+
     from .http import HTTPClient
 else:
     HTTPClient = object
@@ -48,6 +48,7 @@ class User(Page, SubscribableMixin):
         "_cs_avatar_url",
         "_cs_pseuds",
         "_cs_date_joined",
+        "_cs_bio",
         "_cs_nworks",
         "_cs_nseries",
         "_cs_nbookmarks",
@@ -220,9 +221,9 @@ class User(Page, SubscribableMixin):
 
     async def reload(self) -> None:
         text = await self._http.get_user(self.username)
-        self._element = html.fromstring(text)
+        self._element = await _parse_html_off_loop(text)
 
         # Reset relevant cached properties.
         slots = set(self.__slots__).difference(("username", "_id", "_http", "_element"))
         for attr in slots:
-            delattr(self, attr)
+            setattr(self, attr, _UNSET)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import re
+import threading
 from collections.abc import Callable
-from typing import Generic, NamedTuple, TypeVar, overload
+from typing import Any, Generic, NamedTuple, TypeVar, overload
 
-from lxml import html
+from lxml import etree, html
 
 from .errors import InvalidURLError
 
@@ -14,6 +16,8 @@ T_co = TypeVar("T_co", covariant=True)
 
 AO3_STORY_REGEX = re.compile(r"(?:https://|)(?:www\.|)archiveofourown\.org/(?:works|series)/(?P<id>\d+)")
 ICON_URL_USER_ID_REGEX = re.compile(r".*/(\d+)/")
+CSRF_TOKEN_REGEX = re.compile(r'<meta name="csrf-token" content="([^"]*)"')
+LOGIN_TOKEN_REGEX = re.compile(r'<input[^>]*? name="authenticity_token"[^>]*? value="([^"]*)"')
 
 __all__ = (
     "Constraint",
@@ -22,6 +26,26 @@ __all__ = (
 
 AO3_LOGO_URL = "https://archiveofourown.org/images/ao3_logos/logo.png"
 
+# Marks a cached slot as not computed yet, so that None can be cached like any other value. Reloads reset slots to it.
+_UNSET: Any = object()
+
+_parser_local = threading.local()
+
+_PAGINATION_ITEMS_XP = etree.XPath("descendant-or-self::ol[@title = 'pagination']/descendant::li")
+_LOGIN_TOKEN_XP = etree.XPath("descendant-or-self::input[@name = 'authenticity_token']")
+_CSRF_META_XP = etree.XPath("descendant-or-self::meta[@name = 'csrf-token']")
+
+# Pseud pickers on AO3 forms are named like "bookmark[pseud_id]". XPath 1.0 has no ends-with(), hence the substring().
+# The option queries only look at the first such <select>, and the pseud name is bound at call time.
+_PSEUD_NAME_TEST = "substring(@name, string-length(@name) - 9) = '[pseud_id]'"
+_PSEUD_INPUT_XP = etree.XPath(f"descendant-or-self::input[{_PSEUD_NAME_TEST}]")
+_PSEUD_OPTION_BY_NAME_XP = etree.XPath(
+    f"(descendant-or-self::select[{_PSEUD_NAME_TEST}])[1]/descendant::option[string(.) = $pseud]",
+)
+_PSEUD_SELECTED_XP = etree.XPath(
+    f"(descendant-or-self::select[{_PSEUD_NAME_TEST}])[1]/descendant::option[@selected != '']",
+)
+
 
 class CachedSlotProperty(Generic[T, T_co]):
     """An implementation of a cached property for slotted classes.
@@ -45,12 +69,11 @@ class CachedSlotProperty(Generic[T, T_co]):
         if instance is None:
             return self
 
-        try:
-            return getattr(instance, self.name)
-        except AttributeError:
+        value = getattr(instance, self.name, _UNSET)
+        if value is _UNSET:
             value = self.function(instance)
             setattr(instance, self.name, value)
-            return value
+        return value
 
 
 def cached_slot_property(name: str) -> Callable[[Callable[[T], T_co]], CachedSlotProperty[T, T_co]]:
@@ -120,49 +143,72 @@ def get_id_from_url(url: str, *, will_raise: bool = False) -> int | None:
 
 
 def parse_max_pages_num(element: html.HtmlElement) -> int:
-    default_page_num = 1
-    try:
-        num_gen = (int(li.text_content().strip()) for li in element.cssselect("ol[title=pagination] li"))
-        return max(num_gen)
-    except AttributeError:
-        return default_page_num
+    # The pagination list also holds "Previous"/"Next" links and gaps, so only the numbered items are considered.
+    nums = (int(text) for li in _PAGINATION_ITEMS_XP(element) if (text := li.text_content().strip()).isdigit())
+    return max(nums, default=1)
+
+
+def _scan_for_token(pattern: re.Pattern[str], text: str) -> str | None:
+    # Pull a token straight out of raw markup when it's laid out the way AO3 renders it, so that the whole page doesn't
+    # have to be parsed just for one attribute. Anything unusual (e.g. escaped characters) is left to lxml.
+    if (match := pattern.search(text)) and "&" not in (token := match.group(1)):
+        return token
+    return None
 
 
 def extract_login_auth_token(text: str | html.HtmlElement) -> str | None:
-    element = html.fromstring(text) if isinstance(text, str) else text
+    if isinstance(text, str) and (token := _scan_for_token(LOGIN_TOKEN_REGEX, text)):
+        return token
+
+    element = _parse_html(text) if isinstance(text, str) else text
     try:
-        return element.cssselect("input[name=authenticity_token]")[0].get("value", None)
+        return _LOGIN_TOKEN_XP(element)[0].get("value", None)
     except IndexError:
         return None
 
 
 def extract_csrf_token(text: str | html.HtmlElement) -> str | None:
-    element = html.fromstring(text) if isinstance(text, str) else text
+    if isinstance(text, str) and (token := _scan_for_token(CSRF_TOKEN_REGEX, text)):
+        return token
+
+    element = _parse_html(text) if isinstance(text, str) else text
     try:
-        return element.cssselect("meta[name=csrf-token]")[0].get("content", None)
+        return _CSRF_META_XP(element)[0].get("content", None)
     except IndexError:
         return None
 
 
 def extract_pseud_id(element: html.HtmlElement, specified_pseud: str | None = None) -> str | None:
-    pseuds = element.cssselect('input[name$="[pseud_id]"]')
-    if len(pseuds) > 0:
+    if pseuds := _PSEUD_INPUT_XP(element):
         return pseuds[0].get("value")
 
-    pseuds = element.cssselect('select[name$="[pseud_id]"]')
-    if len(pseuds) > 0:
-        return next(
-            (
-                option.get("value")
-                for option in pseuds[0].cssselect("option")
-                if bool(
-                    (str(option.text_content()) == specified_pseud) if specified_pseud else option.get("selected"),
-                )
-            ),
-            None,
-        )
+    options = (
+        _PSEUD_OPTION_BY_NAME_XP(element, pseud=specified_pseud) if specified_pseud else _PSEUD_SELECTED_XP(element)
+    )
+    return options[0].get("value") if options else None
 
-    return None
+
+def _get_html_parser() -> html.HTMLParser:
+    # Parser objects are reusable but not thread-safe, and pages are parsed in executor threads, so keep one per thread.
+    # Comments never carry data we read, so they're dropped at parse time. Blank text is kept on purpose: stripping it
+    # would eat the spaces between inline tags in summaries, notes, etc. AO3 only serves UTF-8, so raw response bytes
+    # can be handed over as-is instead of being decoded to str first; str input is unaffected by the encoding.
+    try:
+        return _parser_local.parser
+    except AttributeError:
+        parser = _parser_local.parser = html.HTMLParser(encoding="utf-8", remove_comments=True, huge_tree=True)
+        return parser
+
+
+def _parse_html(text: str | bytes) -> html.HtmlElement:
+    return html.fromstring(text, parser=_get_html_parser())
+
+
+async def _parse_html_off_loop(text: str | bytes) -> html.HtmlElement:
+    # libxml2 releases the GIL while parsing, so doing it in a worker thread lets the event loop keep servicing other
+    # requests in the meantime. asyncio.to_thread() would be neater, but it's 3.9+.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _parse_html, text)
 
 
 def int_or_none(data: str | None) -> int | None:
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import datetime
+import sys
 from collections.abc import Iterator, Mapping
 from itertools import chain
 from typing import TYPE_CHECKING
 
-from lxml import html
-
-from ._selectors import WORK_SELECTORS
+from ._selectors import WORK_BANNER_SELECTORS, WORK_SELECTORS
 from .abc import (
     BookmarkableMixin,
     CollectableMixin,
@@ -18,10 +17,11 @@ from .abc import (
 from .enums import Language
 from .errors import AO3Exception, UnloadedError
 from .object import Object
-from .utils import cached_slot_property, get_id_from_url, int_or_none
+from .utils import _UNSET, _parse_html_off_loop, cached_slot_property, get_id_from_url, int_or_none
 
 
 if TYPE_CHECKING:
+    from lxml import html
     from typing_extensions import Self
 
     from .http import HTTPClient
@@ -71,6 +71,7 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         "_cs_nkudos",
         "_cs_nbookmarks",
         "_cs_nhits",
+        "_cs_meta",
     )
 
     def __init__(
@@ -125,6 +126,21 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
 
         return f"https://archiveofourown.org/works/{self.id}"
 
+    @cached_slot_property("_cs_meta")
+    def _meta(self) -> dict[str, html.HtmlElement]:
+        # Walk the work's meta block once and index each <dd> by its leading class name, e.g. "rating" or "words".
+        # The names come fresh from lxml, so intern them; lookups with the literal keys below are then identity hits.
+        if self.raw_element is None:
+            raise UnloadedError
+        return {
+            sys.intern((el.get("class") or "").partition(" ")[0]): el for el in WORK_SELECTORS["meta"](self.raw_element)
+        }
+
+    def _meta_tags(self, key: str) -> tuple[str, ...]:
+        if (dd := self._meta.get(key)) is None:
+            return ()
+        return tuple(str(el.text_content()) for el in WORK_SELECTORS["meta_tags"](dd))
+
     @cached_slot_property("_cs_title")
     def title(self) -> str:
         """:class:`str`: The work's title."""
@@ -195,8 +211,8 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             raise UnloadedError
         try:
-            return str(WORK_SELECTORS["rating"](self.raw_element)[0].text_content()).strip()
-        except (IndexError, ValueError):
+            return str(WORK_SELECTORS["meta_tags"](self._meta["rating"])[0].text_content()).strip()
+        except (IndexError, KeyError, ValueError):
             return ""
 
     @cached_slot_property("_cs_warnings")
@@ -207,7 +223,7 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         """
         if self.raw_element is None:
             raise UnloadedError
-        return tuple(str(el.text_content()) for el in WORK_SELECTORS["warnings"](self.raw_element))
+        return self._meta_tags("warning")
 
     @cached_slot_property("_cs_categories")
     def categories(self) -> tuple[str, ...]:
@@ -215,7 +231,7 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
 
         if self.raw_element is None:
             raise UnloadedError
-        return tuple(str(el.text_content()) for el in WORK_SELECTORS["categories"](self.raw_element))
+        return self._meta_tags("category")
 
     @cached_slot_property("_cs_fandoms")
     def fandoms(self) -> tuple[str, ...]:
@@ -223,7 +239,7 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
 
         if self.raw_element is None:
             raise UnloadedError
-        return tuple(str(el.text_content()) for el in WORK_SELECTORS["fandoms"](self.raw_element))
+        return self._meta_tags("fandom")
 
     @cached_slot_property("_cs_relationships")
     def relationships(self) -> tuple[str, ...]:
@@ -231,7 +247,7 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
 
         if self.raw_element is None:
             raise UnloadedError
-        return tuple(str(el.text_content()) for el in WORK_SELECTORS["relationships"](self.raw_element))
+        return self._meta_tags("relationship")
 
     @cached_slot_property("_cs_characters")
     def characters(self) -> tuple[str, ...]:
@@ -239,7 +255,7 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
 
         if self.raw_element is None:
             raise UnloadedError
-        return tuple(str(el.text_content()) for el in WORK_SELECTORS["characters"](self.raw_element))
+        return self._meta_tags("character")
 
     @cached_slot_property("_cs_freeforms")
     def freeforms(self) -> tuple[str, ...]:
@@ -247,7 +263,7 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
 
         if self.raw_element is None:
             raise UnloadedError
-        return tuple(str(el.text_content()) for el in WORK_SELECTORS["freeforms"](self.raw_element))
+        return self._meta_tags("freeform")
 
     def all_tags(self) -> Iterator[str]:
         """An lazy iterator that provides all of this work's "tags" in one go.
@@ -282,8 +298,8 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             return Language.UNKNOWN
         try:
-            return Language(WORK_SELECTORS["language"](self.raw_element)[0].text)
-        except (IndexError, ValueError):
+            return Language(self._meta["language"].text)
+        except (KeyError, ValueError):
             return Language.UNKNOWN
 
     @cached_slot_property("_cs_date_published")
@@ -293,9 +309,9 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             raise UnloadedError
         try:
-            text = str(WORK_SELECTORS["date_published"](self.raw_element)[0].text)
+            text = str(self._meta["published"].text)
             return datetime.datetime.strptime(text or "", "%Y-%m-%d").astimezone()
-        except (IndexError, ValueError):
+        except (KeyError, ValueError):
             return None
 
     @cached_slot_property("_cs_date_updated")
@@ -305,9 +321,9 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             raise UnloadedError
         try:
-            text = str(WORK_SELECTORS["date_updated"](self.raw_element)[0].text)
+            text = str(self._meta["updated"].text)
             return datetime.datetime.strptime(text or "", "%Y-%m-%d").astimezone()
-        except (IndexError, ValueError):
+        except (KeyError, ValueError):
             return None
 
     @cached_slot_property("_cs_nwords")
@@ -317,9 +333,9 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             raise UnloadedError
         try:
-            text = str(WORK_SELECTORS["nwords"](self.raw_element)[0].text)
+            text = str(self._meta["words"].text)
             return result if (result := int_or_none(text)) else 0
-        except (IndexError, ValueError):
+        except (KeyError, ValueError):
             return 0
 
     @cached_slot_property("_cs_nchapters")
@@ -332,10 +348,10 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             raise UnloadedError
         try:
-            text = str(WORK_SELECTORS["nchapters"](self.raw_element)[0].text)
+            text = str(self._meta["chapters"].text)
             current, _, expected = text.partition("/")
             return (int_or_none(current), int_or_none(expected))
-        except (IndexError, ValueError):
+        except (KeyError, ValueError):
             return (None, None)
 
     @property
@@ -354,9 +370,9 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             raise UnloadedError
         try:
-            text = str(WORK_SELECTORS["ncomments"](self.raw_element)[0].text)
+            text = str(self._meta["comments"].text)
             return result if (result := int_or_none(text)) else 0
-        except (IndexError, ValueError):
+        except (KeyError, ValueError):
             return 0
 
     @cached_slot_property("_cs_nkudos")
@@ -366,9 +382,9 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             raise UnloadedError
         try:
-            text = str(WORK_SELECTORS["nkudos"](self.raw_element)[0].text)
+            text = str(self._meta["kudos"].text)
             return result if (result := int_or_none(text)) else 0
-        except (IndexError, ValueError):
+        except (KeyError, ValueError):
             return 0
 
     @cached_slot_property("_cs_nbookmarks")
@@ -378,9 +394,9 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             raise UnloadedError
         try:
-            text = str(WORK_SELECTORS["nbookmarks"](self.raw_element)[0].text_content())
+            text = str(self._meta["bookmarks"].text_content())
             return result if (result := int_or_none(text)) else 0
-        except (IndexError, ValueError):
+        except (KeyError, ValueError):
             return 0
 
     @cached_slot_property("_cs_nhits")
@@ -390,9 +406,9 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         if self.raw_element is None:
             raise UnloadedError
         try:
-            text = str(WORK_SELECTORS["nhits"](self.raw_element)[0].text)
+            text = str(self._meta["hits"].text)
             return result if (result := int_or_none(text)) else 0
-        except (IndexError, ValueError):
+        except (KeyError, ValueError):
             return 0
 
     @property
@@ -415,68 +431,63 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
         from .series import Series
         from .user import User
 
+        sel = WORK_BANNER_SELECTORS
+
         try:
-            work_el = work_element.cssselect('a[href^="/works"]')[0]
+            work_el = sel["link"](work_element)[0]
             title = str(work_el.text_content())
             work_id = get_id_from_url("archiveofourown.org" + (work_el.get("href") or ""))
         except (IndexError, ValueError) as err:
             raise AO3Exception from err
 
-        authors = [
-            Object(name=el.get("href", "").split("/")[1], type=User)
-            for el in work_element.cssselect('h4 a > [rel*="author"]')
-        ]
-        restricted = len(work_element.cssselect('img [title*="Restricted"]')) > 0
+        authors = [Object(name=el.get("href", "").split("/")[1], type=User) for el in sel["authors"](work_element)]
+        restricted = len(sel["restricted"](work_element)) > 0
         series = [
             Object(id=int(href.rpartition("/")[-1]), type=Series)
-            for el in work_element.cssselect(".series a")
+            for el in sel["series"](work_element)
             if (href := el.get("href"))
         ]
-        summary = str(el[0].text_content()) if (el := work_element.cssselect(".userstuff.summary")) else None
-        rating = str(el[0].text_content()) if (el := work_element.cssselect(".required-tags .rating")) else None
-        warnings = [str(el.text_content()) for el in work_element.cssselect(".tags li.warnings")]
+        summary = str(el[0].text_content()) if (el := sel["summary"](work_element)) else None
+        rating = str(el[0].text_content()) if (el := sel["rating"](work_element)) else None
+        warnings = [str(el.text_content()) for el in sel["warnings"](work_element)]
 
         try:
-            categories = str(work_element.cssselect(".required-tags .category")[0].text_content()).split(",")
+            categories = str(sel["categories"](work_element)[0].text_content()).split(",")
         except IndexError:
             categories = None
 
-        fandoms = [str(el.text_content()) for el in work_element.cssselect("h5.fandoms a")]
-        relationships = [str(el.text_content()) for el in work_element.cssselect(".tags li.relationships")]
-        characters = [str(el.text_content()) for el in work_element.cssselect(".tags li.characters")]
-        freeforms = [str(el.text_content()) for el in work_element.cssselect(".tags li.freeforms")]
+        fandoms = [str(el.text_content()) for el in sel["fandoms"](work_element)]
+        relationships = [str(el.text_content()) for el in sel["relationships"](work_element)]
+        characters = [str(el.text_content()) for el in sel["characters"](work_element)]
+        freeforms = [str(el.text_content()) for el in sel["freeforms"](work_element)]
 
         try:
-            language = Language(str(work_element.cssselect(".stats dd.language")[0].text_content()))
+            language = Language(str(sel["language"](work_element)[0].text_content()))
         except IndexError:
             language = Language.UNKNOWN
 
         try:
-            date = str(work_element.cssselect("p.datetime")[0].text_content())
+            date = str(sel["date"](work_element)[0].text_content())
             date_updated = datetime.datetime.strptime(date, "%d %b %Y").astimezone()
         except IndexError:
             date_updated = None
 
         try:
-            words = int_or_none(str(work_element.cssselect(".stats dd.words")[0].text_content()))
+            words = int_or_none(str(sel["words"](work_element)[0].text_content()))
         except IndexError:
             words = None
 
-        chapters_el = work_element.cssselect(".stats dd.chapters")
+        chapters_el = sel["chapters"](work_element)
         if len(el := chapters_el[0]):
             current, _, expected = str(el.text_content()).partition("/")
             chapters = (int_or_none(current), int_or_none(expected))
         else:
             chapters = (None, None)
 
-        comments = (
-            int_or_none(str(el[0].text_content())) if (el := work_element.cssselect(".stats dd.comments")) else None
-        )
-        kudos = int_or_none(str(el[0].text_content())) if (el := work_element.cssselect(".stats dd.kudos")) else None
-        bookmarks = (
-            int_or_none(str(el[0].text_content())) if (el := work_element.cssselect(".stats dd.bookmarks")) else None
-        )
-        hits = int_or_none(str(el[0].text)) if (el := work_element.cssselect(".stats dd.hits")) else None
+        comments = int_or_none(str(el[0].text_content())) if (el := sel["comments"](work_element)) else None
+        kudos = int_or_none(str(el[0].text_content())) if (el := sel["kudos"](work_element)) else None
+        bookmarks = int_or_none(str(el[0].text_content())) if (el := sel["bookmarks"](work_element)) else None
+        hits = int_or_none(str(el[0].text)) if (el := sel["hits"](work_element)) else None
 
         payload = {
             "_id": work_id,
@@ -506,9 +517,9 @@ class Work(Page, KudoableMixin, BookmarkableMixin, SubscribableMixin, Collectabl
 
     async def reload(self) -> None:
         text = await self._http.get_work(self.id)
-        self._element = html.fromstring(text)
+        self._element = await _parse_html_off_loop(text)
 
         # Reset cached properties.
         slots = set(self.__slots__).difference(("_id", "_http", "_element"))
         for attr in slots:
-            delattr(self, attr)
+            setattr(self, attr, _UNSET)
@@ -41,6 +41,20 @@ class catchtime:
         self.readout = f"Time: {self.time:.3f} seconds"
 
 
+def exports_test() -> None:
+    log.info("----------EXPORTS TESTING----------")
+
+    # __all__ is written out for type checkers, so make sure it hasn't drifted from the lazily loaded names.
+    expected = (*ao3._LAZY_SUBMODULES, *(name for names in ao3._SUBMODULE_EXPORTS.values() for name in names))
+    assert sorted(ao3.__all__) == sorted(expected), set(ao3.__all__).symmetric_difference(expected)
+
+    for name in ao3.__all__:
+        assert getattr(ao3, name) is not None
+
+    log.info("exports: %s", len(ao3.__all__))
+    log.info("--------------------------------------------------")
+
+
 async def get_work_test(client: ao3.Client) -> None:
     url = "https://archiveofourown.org/works/48637876"
 
@@ -177,6 +191,8 @@ async def get_search_test(client: ao3.Client) -> None:
 
 
 async def run_tests() -> None:
+    exports_test()
+
     async with ao3.Client() as client:
         await get_work_test(client)
         await get_series_test(client)